@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check for the bird hitbox collision.
+
+Compares the exact ellipse-vs-rect test with the previous 32-point edge
+sampler over random bird poses and rects:
+- every hit found by the sampler must also be found by the exact test
+- every extra hit of the exact test must be a real overlap, confirmed by
+  densely sampling the ellipse interior
+- the vectorized BatchGame variant must agree with the scalar exact test
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.constants import *
+from src.core.game import BirdState
+from src.core.rect import Rect
+
+
+def random_case(rng):
+    bird = BirdState()
+    bird.y = rng.uniform(-50, HEIGHT)
+    bird.angle = rng.uniform(-30, 90)
+    cx = bird.x + BIRD_SIZE // 2
+    cy = bird.y + BIRD_SIZE // 2
+    # Rects around the hitbox, from slivers to full pipes
+    width = rng.choice([1, 2, 5, OBSTACLE_WIDTH, WIDTH])
+    height = rng.choice([1, 2, 5, 80, 300])
+    rect = Rect(cx + rng.uniform(-width - 25, 25), cy + rng.uniform(-height - 25, 25), width, height)
+    return bird, rect
+
+
+def dense_overlap(bird, rect, steps=400):
+    # Brute force: sample the ellipse interior on a polar grid
+    cx = bird.x + BIRD_SIZE // 2
+    cy = bird.y + BIRD_SIZE // 2
+    angle_rad = math.radians(-bird.angle)
+    cos_angle, sin_angle = math.cos(angle_rad), math.sin(angle_rad)
+    for i in range(steps):
+        theta = 2 * math.pi * i / steps
+        for r in (0.25, 0.5, 0.75, 0.9, 0.97, 1.0):
+            ex = r * bird.hitbox_width / 2 * math.cos(theta)
+            ey = r * bird.hitbox_height / 2 * math.sin(theta)
+            # Undo the rotation used by point_in_ellipse
+            px = cx + ex * cos_angle - ey * sin_angle
+            py = cy + ex * sin_angle + ey * cos_angle
+            if rect.left <= px <= rect.right and rect.top <= py <= rect.bottom:
+                return True
+    return False
+
+
+def check_equivalence(cases):
+    missed = 0
+    extra = 0
+    unconfirmed = 0
+    for bird, rect in cases:
+        sampled = bird.collides_with_rect_sampled(rect)
+        exact = bird.collides_with_rect(rect)
+        if sampled and not exact:
+            missed += 1
+        elif exact and not sampled:
+            extra += 1
+            if not dense_overlap(bird, rect, steps=2000):
+                unconfirmed += 1
+    return missed, extra, unconfirmed
+
+
+def check_batched(cases):
+    try:
+        import numpy as np
+        from src.core.batch import ellipse_rects_overlap
+    except ImportError:
+        return None
+    cx = np.array([b.x + BIRD_SIZE // 2 for b, _ in cases], dtype=float)
+    cy = np.array([b.y + BIRD_SIZE // 2 for b, _ in cases], dtype=float)
+    angle_rad = np.radians(-np.array([b.angle for b, _ in cases]))
+    bird = cases[0][0]
+    hits = ellipse_rects_overlap(
+        cx, cy, bird.hitbox_width / 2, bird.hitbox_height / 2,
+        np.cos(angle_rad), np.sin(angle_rad),
+        np.array([r.left for _, r in cases], dtype=float),
+        np.array([r.top for _, r in cases], dtype=float),
+        np.array([r.right for _, r in cases], dtype=float),
+        np.array([r.bottom for _, r in cases], dtype=float)
+    )
+    return sum(bool(h) != b.collides_with_rect(r) for h, (b, r) in zip(hits, cases))
+
+
+def bench(label, func, cases, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for bird, rect in cases:
+            func(bird, rect)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / (repeat * len(cases)) * 1e6
+    print(f"{label:>10}: {per_call:.2f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the bird collision test')
+    parser.add_argument('--cases', type=int, default=20000, help='Random poses to test')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [random_case(rng) for _ in range(args.cases)]
+
+    missed, extra, unconfirmed = check_equivalence(cases)
+    print(f"Sampler hits missed by exact test: {missed}")
+    print(f"Overlaps found only by exact test: {extra} ({unconfirmed} unconfirmed)")
+    batched = check_batched(cases)
+    if batched is not None:
+        print(f"Batched mismatches: {batched}")
+
+    bench('sampled', lambda b, r: b.collides_with_rect_sampled(r), cases, args.repeat)
+    bench('exact', lambda b, r: b.collides_with_rect(r), cases, args.repeat)
+
+    if missed or unconfirmed or batched:
+        print("Equivalence check FAILED", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
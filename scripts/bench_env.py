@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark of FlappyEnv step overhead.
+
+Times env.step() in both observation modes against bare GameState.step(),
+playing the same seeded rounds with the same scripted flaps, and reports
+microseconds per step and what the wrapper adds in feature mode.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.game import GameState, PLAYING
+from src.core.rng import RngStreams
+from src.env import FlappyEnv, FEATURES, PIXELS
+
+# Flap every this many steps; keeps rounds going for a while without a policy
+FLAP_EVERY = 14
+
+
+def bench_core(steps, seed):
+    streams = RngStreams(seed)
+    game = GameState(rng=streams.gameplay)
+    streams.new_round()
+    game.start()
+    start = time.perf_counter()
+    for i in range(steps):
+        game.step(i % FLAP_EVERY == 0)
+        if game.game_state != PLAYING:
+            streams.new_round()
+            game.start()
+    return (time.perf_counter() - start) / steps
+
+
+def bench_env(observation, steps, seed):
+    env = FlappyEnv(observation, seed=seed)
+    env.reset()
+    start = time.perf_counter()
+    for i in range(steps):
+        obs, reward, terminated, truncated, info = env.step(i % FLAP_EVERY == 0)
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    env.close()
+    return elapsed / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark FlappyEnv step overhead')
+    parser.add_argument('--steps', type=int, default=200000, help='Steps in feature mode and for GameState')
+    parser.add_argument('--pixel-steps', type=int, default=2000, help='Steps in pixel mode')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    core = bench_core(args.steps, args.seed)
+    features = bench_env(FEATURES, args.steps, args.seed)
+    pixels = bench_env(PIXELS, args.pixel_steps, args.seed)
+
+    print(f"GameState.step:        {core * 1e6:8.2f} us/step")
+    print(f"FlappyEnv (features):  {features * 1e6:8.2f} us/step "
+          f"({(features - core) * 1e6:+.2f} us over GameState)")
+    print(f"FlappyEnv (pixels):    {pixels * 1e6:8.2f} us/step")
+
+
+if __name__ == '__main__':
+    main()
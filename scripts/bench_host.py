@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Load test of GameHost: run a host on a Unix socket with N bot clients in
+the same event loop and report, per session count, the tick rate reached,
+the host's time per tick and how many state frames reached the clients.
+
+    python scripts/bench_host.py --sessions 10,100,500 --seconds 5
+
+The bots flap when their bird sinks below the next gap and start a new
+round whenever theirs ends. They share the process with the host, so the
+tick rate drops once host and bots together need more than one core.
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.utils.constants import *
+from src.core.game import START, PLAYING, GAME_OVER
+from src.core.host import GameHost, HELLO, PRESS, STATES, STATE_DTYPE, decode_states
+
+
+async def bot(path, stats, stopping):
+    reader, writer = await asyncio.open_unix_connection(path)
+    await reader.readexactly(HELLO.size)
+    try:
+        while not stopping.is_set():
+            frame = decode_states(await reader.readexactly(STATE_DTYPE.itemsize))[0]
+            stats['frames'] += 1
+            state = STATES[frame['state']]
+            if state in (START, GAME_OVER):
+                writer.write(PRESS)
+            elif state == PLAYING and frame['velocity'] > 0 and \
+                    frame['bird_y'] + BIRD_SIZE / 2 > frame['next_gap_y'] + 20:
+                writer.write(PRESS)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run(sessions, seconds, hz, seed, record_replays):
+    host = GameHost(sessions, hz, seed, record_replays)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'host.sock')
+        server = await host.serve_unix(path)
+        stats = {'frames': 0}
+        stopping = asyncio.Event()
+        bots = [asyncio.create_task(bot(path, stats, stopping)) for _ in range(sessions)]
+        ticking = asyncio.create_task(host.run())
+
+        # Measure once every bot is connected
+        while len(host.sessions) < sessions:
+            for task in bots:
+                if task.done():
+                    task.result()  # Raises why the bot could not connect
+            await asyncio.sleep(0.01)
+        ticks, busy, frames = host.tick_count, host.tick_seconds, stats['frames']
+        await asyncio.sleep(seconds)
+        ticks, busy, frames = host.tick_count - ticks, host.tick_seconds - busy, stats['frames'] - frames
+        dropped = sum(session.dropped for session in host.sessions.values())
+
+        host.stop()
+        stopping.set()
+        server.close()
+        await ticking
+        for task in bots:
+            task.cancel()
+        await asyncio.gather(*bots, return_exceptions=True)
+        await server.wait_closed()
+
+    print(f"{sessions:6d} sessions: {ticks / seconds:6.1f} ticks/s, {busy / ticks * 1000:6.3f} ms/tick in host, "
+          f"{frames / seconds:9.0f} frames/s to clients ({dropped} dropped)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test GameHost with bot clients')
+    parser.add_argument('--sessions', default='10,100,500', help='Comma separated session counts')
+    parser.add_argument('--seconds', type=float, default=5.0, help='How long to measure each count')
+    parser.add_argument('--physics-hz', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--record-replays', metavar='DIR', default=None,
+                        help='Save every finished round, e.g. to check with verify_replays.py')
+    args = parser.parse_args()
+    if args.record_replays:
+        os.makedirs(args.record_replays, exist_ok=True)
+
+    for sessions in (int(count) for count in args.sessions.split(',')):
+        asyncio.run(run(sessions, args.seconds, args.physics_hz, args.seed, args.record_replays))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the serial main loop against the --threaded pipeline.
+
+Both modes simulate in real time at the physics rate and draw as many
+frames as they can, with the same scripted flaps, scaling to a typical
+window through the smooth output stage. Reported per mode:
+
+- frames drawn per second and physics steps per second
+- latency, from a physics step finishing to the first present that shows
+  it, as p50 and p99
+
+The pipeline only gains where drawing and presenting release the GIL on
+another core; on a single core both threads share it.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.utils.startup import import_pygame
+import_pygame()
+import pygame
+from functools import partial
+
+from src.utils.constants import *
+from src.core.game import GameState, PLAYING
+from src.core.rng import make_rng, GAMEPLAY, EFFECTS, SCENERY
+from src.core.timestep import FixedTimestep
+from src.core.pipeline import SimulationThread
+from src.main import update_world, draw_world
+from src.entities.bird import Bird
+from src.entities.obstacle import Obstacle
+from src.entities.background import Background
+from src.render.particles import get_particle_system
+from src.render.hud import Hud
+from src.render.output import OutputStage
+
+# Flap every this many steps; keeps rounds going for a while without a policy
+FLAP_EVERY = 14
+
+WINDOW_SIZE = (1280, 960)
+
+
+def world(seed):
+    game = GameState(rng=make_rng(seed, GAMEPLAY), bird_factory=Bird,
+                     obstacle_factory=partial(Obstacle, rng=make_rng(seed, EFFECTS)))
+    background = Background(rng=make_rng(seed, SCENERY))
+    particles = get_particle_system()
+    particles.clear()
+    hud = Hud(pygame.font.Font(None, 55))
+
+    def step(dt):
+        if game.game_state != PLAYING:
+            game.start()
+            particles.clear()
+        elif game.frame % FLAP_EVERY == 0:
+            game.press()
+        update_world(game, background, particles, dt)
+    return game, background, particles, hud, step
+
+
+def render(surface, output, game, background, particles, hud, alpha):
+    surface.fill((0, 0, 0))
+    draw_world(surface, game, background, particles, hud, alpha=alpha)
+    output.present(surface)
+
+
+def run_serial(seconds, hz, seed, surface, output):
+    game, background, particles, hud, step = world(seed)
+    timestep = FixedTimestep(hz)
+    frames = steps = 0
+    latencies = []
+    last = time.perf_counter()
+    end = last + seconds
+    while last < end:
+        now = time.perf_counter()
+        count = timestep.advance(now - last)
+        last = now
+        for _ in range(count):
+            step(timestep.dt)
+        stepped = time.perf_counter()
+        render(surface, output, game, background, particles, hud, timestep.alpha)
+        frames += 1
+        steps += count
+        if count:
+            latencies.append(time.perf_counter() - stepped)
+    return frames, steps, latencies
+
+
+def run_threaded(seconds, hz, seed, surface, output):
+    game, background, particles, hud, step = world(seed)
+    simulation = SimulationThread(
+        FixedTimestep(hz), step, game.press,
+        lambda: (game.snapshot(), background.snapshot(), particles.snapshot())
+    )
+    frames = 0
+    latencies = []
+    shown = None
+    start = time.perf_counter()
+    simulation.start()
+    while time.perf_counter() < start + seconds:
+        (view_game, view_background, view_particles), published_at = simulation.buffer.latest()
+        alpha = min(1.0, (time.perf_counter() - published_at) * hz)
+        render(surface, output, view_game, view_background, view_particles, hud, alpha)
+        frames += 1
+        if published_at != shown:
+            shown = published_at
+            latencies.append(time.perf_counter() - published_at)
+    simulation.stop()
+    if simulation.error is not None:
+        raise RuntimeError("The simulation thread failed") from simulation.error
+    return frames, simulation.steps, latencies
+
+
+def report(name, seconds, frames, steps, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:9s} {frames / seconds:8.1f} frames/s {steps / seconds:7.1f} steps/s   "
+          f"latency p50 {statistics.median(latencies) * 1000:6.2f} ms  p99 {p99 * 1000:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the serial loop against the threaded pipeline')
+    parser.add_argument('--seconds', type=float, default=5.0, help='How long to run each mode')
+    parser.add_argument('--physics-hz', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    output = OutputStage(pygame.display.set_mode(WINDOW_SIZE), 'smooth')
+
+    for name, run in (("serial", run_serial), ("threaded", run_threaded)):
+        report(name, args.seconds, *run(args.seconds, args.physics_hz, args.seed, surface, output))
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the per-frame hot paths.
+
+Runs headless on SDL's dummy video driver. Every case is timed with
+enough calls per run to last about RUN_TIME, and the fastest of --repeat
+runs is kept, which is the least noisy figure on a busy machine.
+
+    python scripts/benchmark.py --save baseline.json
+    python scripts/benchmark.py --compare baseline.json --threshold 10
+
+--compare exits with status 1 when any case got slower than the baseline
+by more than --threshold percent. Baselines are only comparable on the
+same machine.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.utils.startup import import_pygame
+import_pygame()
+import pygame
+import numpy as np
+
+from src.utils.constants import *
+from src.core.game import GameState, PLAYING
+from src.core.rect import Rect
+from src.core.rng import make_rng, GAMEPLAY, EFFECTS, SCENERY
+
+BASELINE_VERSION = 1
+
+# Target duration of one timed run, in seconds
+RUN_TIME = 0.05
+
+# Window size for the output stage; a typical non-integer upscale
+WINDOW_SIZE = (1280, 960)
+
+SEED = 0
+
+CASES = {}
+
+
+def case(name):
+    """Register a benchmark. The function sets up and returns the callable to time."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def collision_case(angle):
+    def setup():
+        from src.entities.bird import Bird
+        bird = Bird()
+        bird.angle = angle
+        cx = bird.x + BIRD_SIZE // 2
+        cy = bird.y + BIRD_SIZE // 2
+        # A pipe pair around the bird plus rects grazing each side of the hitbox
+        rects = [
+            Rect(cx - 20, 0, OBSTACLE_WIDTH, cy - 40),
+            Rect(cx - 20, cy + 40, OBSTACLE_WIDTH, HEIGHT - cy - 40),
+            Rect(cx + 12, cy - 5, 30, 10),
+            Rect(cx - 42, cy - 5, 30, 10),
+            Rect(cx - 5, cy + 10, 10, 30),
+            Rect(cx - 5, cy - 40, 10, 30),
+        ]
+
+        def run():
+            for rect in rects:
+                bird.collides_with_rect(rect)
+        return run
+    return setup
+
+
+for _angle in (-30, 0, 45, 90):
+    case(f"bird.collides_with_rect[angle={_angle}]")(collision_case(_angle))
+
+
+def seeded_obstacles(rng, effects, count=3):
+    from src.entities.obstacle import Obstacle
+    return [Obstacle(WIDTH - i * SPACING, rng.randint(200, 400), rng=effects) for i in range(count)]
+
+
+@case("obstacle.__init__")
+def bench_obstacle_init():
+    from src.entities.obstacle import Obstacle
+    effects = make_rng(SEED, EFFECTS)
+    Obstacle(WIDTH, HEIGHT // 2, rng=effects)  # Shared pipe artwork is built once per process
+
+    def run():
+        Obstacle(WIDTH, HEIGHT // 2, rng=effects)
+    return run
+
+
+@case("obstacle.draw+particles")
+def bench_obstacle_draw():
+    from src.render.particles import get_particle_system
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    particles = get_particle_system()
+    particles.clear()
+    obstacles = seeded_obstacles(make_rng(SEED, GAMEPLAY), make_rng(SEED, EFFECTS))
+    # Let the obstacles emit a steady-state amount of ambient particles
+    for _ in range(120):
+        particles.update(1 / 60)
+        for obs in obstacles:
+            obs.update(0, 0)
+
+    def run():
+        for obs in obstacles:
+            obs.draw(surface)
+        particles.draw(surface)
+    return run
+
+
+@case("background.__init__")
+def bench_background_init():
+    from src.entities.background import Background
+    scenery = make_rng(SEED, SCENERY)
+    Background(rng=scenery)
+
+    def run():
+        Background(rng=scenery)
+    return run
+
+
+@case("background.draw")
+def bench_background_draw():
+    from src.entities.background import Background
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    background = Background(rng=make_rng(SEED, SCENERY))
+    background.update(1 / 60, 0)
+
+    def run():
+        background.draw(surface, alpha=0.5)
+    return run
+
+
+@case("bird.draw+trail")
+def bench_bird_draw():
+    from src.entities.bird import Bird
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    bird = Bird()
+    bird.flap()
+    # Fill the motion trail
+    for _ in range(6):
+        bird.update(1 / 60, 0)
+
+    def run():
+        bird.draw(surface, alpha=0.5)
+    return run
+
+
+@case("output.smoothscale")
+def bench_output():
+    from src.render.output import OutputStage
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    output = OutputStage(pygame.display.set_mode(WINDOW_SIZE), 'smooth')
+    output.present(surface)  # Allocates the buffer and clears the borders
+
+    def run():
+        output.present(surface)
+    return run
+
+
+def world(rng_seed=SEED):
+    # The objects src.main builds for a session
+    from functools import partial
+    from src.entities.bird import Bird
+    from src.entities.obstacle import Obstacle
+    from src.entities.background import Background
+    from src.render.particles import get_particle_system
+    from src.render.hud import Hud
+    effects = make_rng(rng_seed, EFFECTS)
+    game = GameState(rng=make_rng(rng_seed, GAMEPLAY), bird_factory=Bird,
+                     obstacle_factory=partial(Obstacle, rng=effects))
+    background = Background(rng=make_rng(rng_seed, SCENERY))
+    particles = get_particle_system()
+    particles.clear()
+    hud = Hud(pygame.font.Font(None, 55))
+    return game, background, particles, hud
+
+
+def autopilot(game):
+    # Flap when sinking below the next gap, which survives for a long time
+    bird = game.bird
+    obs = game.next_obstacle()
+    gap_y = obs.gap_y if obs is not None else HEIGHT // 2
+    return bird.velocity > 0 and bird.y + BIRD_SIZE / 2 > gap_y + 20
+
+
+@case("frame.full")
+def bench_frame():
+    from src.main import update_world, draw_world
+    from src.render.output import OutputStage
+    game, background, particles, hud = world()
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    output = OutputStage(pygame.display.set_mode(WINDOW_SIZE), 'smooth')
+    game.start()
+
+    def run():
+        # One physics step and one rendered frame, as in the main loop
+        if game.game_state != PLAYING:
+            game.start()
+            particles.clear()
+        if autopilot(game):
+            game.press()
+        update_world(game, background, particles, 1 / 60)
+        surface.fill((0, 0, 0))
+        draw_world(surface, game, background, particles, hud, alpha=0.5)
+        output.present(surface)
+    return run
+
+
+@case("frame.update")
+def bench_frame_update():
+    from src.main import update_world
+    game, background, particles, hud = world()
+    game.start()
+
+    def run():
+        if game.game_state != PLAYING:
+            game.start()
+            particles.clear()
+        if autopilot(game):
+            game.press()
+        update_world(game, background, particles, 1 / 60)
+    return run
+
+
+def measure(run, repeat):
+    # Calls per run, doubled until a run lasts RUN_TIME
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= RUN_TIME:
+            break
+        number *= 2
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - start) / number)
+    return {"best": min(times), "median": statistics.median(times), "number": number}
+
+
+def run_benchmarks(names, repeat):
+    results = {}
+    for name in names:
+        run = CASES[name]()
+        results[name] = measure(run, repeat)
+        print(f"{name:40s} {results[name]['best'] * 1e6:10.2f} us "
+              f"(median {results[name]['median'] * 1e6:.2f} us, {results[name]['number']} calls/run)")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the change against baseline per case; return the regressed case names."""
+    regressed = []
+    print()
+    print(f"{'case':40s} {'baseline':>12s} {'now':>12s} {'change':>8s}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:40s} {'-':>12s} {result['best'] * 1e6:10.2f}us {'new':>8s}")
+            continue
+        change = (result['best'] / base['best'] - 1) * 100
+        flag = ""
+        if change > threshold:
+            regressed.append(name)
+            flag = "  REGRESSED"
+        print(f"{name:40s} {base['best'] * 1e6:10.2f}us {result['best'] * 1e6:10.2f}us {change:+7.1f}%{flag}")
+    for name in baseline:
+        if name not in results:
+            print(f"{name:40s} not run")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the per-frame hot paths')
+    parser.add_argument('--save', metavar='FILE', help='Write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percent slowdown of any case that fails --compare')
+    parser.add_argument('--repeat', type=int, default=7, help='Timed runs per case')
+    parser.add_argument('-k', '--filter', default=None, help='Only run cases whose name contains this')
+    parser.add_argument('--list', action='store_true', help='List the cases and exit')
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.filter is None or args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not names:
+        parser.error(f"No case matches {args.filter!r}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            data = json.load(f)
+        if data.get("version") != BASELINE_VERSION:
+            parser.error(f"{args.compare} is not a version {BASELINE_VERSION} baseline")
+        baseline = data["cases"]
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    results = run_benchmarks(names, args.repeat)
+    pygame.quit()
+
+    if args.save:
+        data = {
+            "version": BASELINE_VERSION,
+            "machine": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "numpy": np.__version__,
+            },
+            "cases": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        print(f"Saved {len(results)} results to {args.save}")
+
+    if baseline is not None:
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            print(f"{len(regressed)} case(s) regressed by more than {args.threshold:g}%")
+            sys.exit(1)
+        print(f"No case regressed by more than {args.threshold:g}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Asset build step: packs the sprites the game uses into a single atlas
+image plus a JSON manifest of sub-rects, so startup reads and decodes one
+file instead of one per sprite.
+
+Sprites are stored pre-scaled: at the exact size the game draws them when
+that size is fixed, or at the largest size the game needs otherwise.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.utils.startup import import_pygame
+import_pygame()
+import pygame
+from src.utils.constants import *
+from src.utils.assets import ASSETS_DIR, ATLAS_DIR, ATLAS_MANIFEST, ATLAS_IMAGE
+
+# Largest per-layer cloud scale used by Background
+CLOUD_LAYER_MAX_SCALE = 1.2
+CLOUD_MAX_SIZE = (int(100 * CLOUD_LAYER_MAX_SCALE * CLOUD_MAX_SCALE),
+                  int(60 * CLOUD_LAYER_MAX_SCALE * CLOUD_MAX_SCALE))
+
+# (filename, size to store, exact) - exact variants are drawn as they are
+# and use the game's own scaling; the others are scaled again at runtime,
+# so they are filtered down for quality
+SPRITES = [
+    (os.path.join('Transparent PNG', 'flying', 'frame-1.png'), (BIRD_SIZE, BIRD_SIZE), True),
+    (os.path.join('Transparent PNG', 'flying', 'frame-2.png'), (BIRD_SIZE, BIRD_SIZE), True),
+    ('cloud1.PNG', CLOUD_MAX_SIZE, False),
+    ('cloud2.PNG', CLOUD_MAX_SIZE, False),
+    ('cloud3.PNG', CLOUD_MAX_SIZE, False),
+]
+
+PADDING = 1
+
+
+def pack_shelves(sizes, atlas_width):
+    """Place sizes on horizontal shelves, tallest first. Returns positions and the total height."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if x and x + width > atlas_width:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+    return positions, y + shelf_height
+
+
+def build_atlas(output_dir=ATLAS_DIR, atlas_width=512):
+    sprites = []
+    for filename, size, exact in SPRITES:
+        image = pygame.image.load(os.path.join(ASSETS_DIR, filename))
+        if exact:
+            scaled = pygame.transform.scale(image, size)
+        else:
+            scaled = pygame.transform.smoothscale(image, size)
+        sprites.append((filename, scaled))
+
+    positions, atlas_height = pack_shelves([s.get_size() for _, s in sprites], atlas_width)
+    atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+
+    manifest = {'image': ATLAS_IMAGE, 'sprites': {}}
+    for (filename, surface), (x, y) in zip(sprites, positions):
+        atlas.blit(surface, (x, y))
+        width, height = surface.get_size()
+        # Manifest keys use forward slashes so the atlas is portable
+        key = filename.replace(os.sep, '/')
+        manifest['sprites'].setdefault(key, []).append({'size': [width, height], 'rect': [x, y, width, height]})
+
+    os.makedirs(output_dir, exist_ok=True)
+    image_path = os.path.join(output_dir, ATLAS_IMAGE)
+    pygame.image.save(atlas, image_path)
+    with open(os.path.join(output_dir, ATLAS_MANIFEST), 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    # Strip metadata and optimize the PNG with the existing cleaner, if PIL is available
+    try:
+        from clean_pngs import clean_png
+    except ImportError:
+        pass
+    else:
+        clean_png(image_path)
+
+    return image_path, atlas.get_size(), len(sprites)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack game sprites into a texture atlas')
+    parser.add_argument('--output', default=ATLAS_DIR, help='Directory for the atlas and manifest')
+    parser.add_argument('--width', type=int, default=512, help='Atlas width in pixels')
+    args = parser.parse_args()
+
+    image_path, size, count = build_atlas(args.output, args.width)
+    print(f"Packed {count} sprites into {image_path} ({size[0]}x{size[1]})")
+
+
+if __name__ == '__main__':
+    main()
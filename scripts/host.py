@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Host many headless games in one process, each played by a client over a
+TCP or Unix socket.
+
+    python scripts/host.py --tcp 127.0.0.1:7777 --max-sessions 512
+    python scripts/host.py --unix /tmp/flappy.sock --record-replays replays/
+
+A client receives a hello (src.core.host.HELLO) and then one state frame
+(src.core.host.STATE_DTYPE) per tick, and sends the byte "p" to press.
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.host import GameHost
+
+
+def parse_address(text):
+    host, sep, port = text.rpartition(':')
+    if not sep or not port.isdigit():
+        raise argparse.ArgumentTypeError("expected HOST:PORT")
+    return host or '127.0.0.1', int(port)
+
+
+async def serve(args):
+    host = GameHost(args.max_sessions, args.physics_hz, args.seed, args.record_replays)
+    if args.unix:
+        server = await host.serve_unix(args.unix)
+        where = args.unix
+    else:
+        server = await host.serve_tcp(*args.tcp)
+        where = ':'.join(str(part) for part in server.sockets[0].getsockname()[:2])
+    print(f"Hosting up to {args.max_sessions} sessions at {args.physics_hz} Hz on {where} "
+          f"(seed {host.seed})")
+    async with server:
+        await host.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Host many concurrent headless games')
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument('--tcp', type=parse_address, default=('127.0.0.1', 7777), metavar='HOST:PORT',
+                         help='Listen on a TCP address (default: 127.0.0.1:7777)')
+    address.add_argument('--unix', metavar='PATH', help='Listen on a Unix socket instead')
+    parser.add_argument('--max-sessions', type=int, default=256, help='Games hosted at once')
+    parser.add_argument('--physics-hz', type=int, default=60, help='Ticks per second')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Host seed; the sessions and their rounds are reproducible from it')
+    parser.add_argument('--record-replays', metavar='DIR', default=None,
+                        help='Save a replay of every finished round to DIR')
+    args = parser.parse_args()
+    if args.max_sessions <= 0:
+        parser.error('--max-sessions must be positive')
+    if args.physics_hz <= 0:
+        parser.error('--physics-hz must be positive')
+    if args.record_replays:
+        os.makedirs(args.record_replays, exist_ok=True)
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
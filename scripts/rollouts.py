@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Balance sweeps: play many headless games per set of constants across all
+cores and print how each set plays.
+
+    python scripts/rollouts.py --episodes 20000 --sweep GAP_HEIGHT=160,180,200
+    python scripts/rollouts.py --set GRAVITY=650 --set FLAP_STRENGTH=270
+"""
+
+import os
+import sys
+import time
+import itertools
+import argparse
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.tuning import Tuning, TUNABLES
+from src.core.rollout import POLICIES, run_rollouts, summarize
+
+
+def parse_value(text):
+    return float(text) if '.' in text else int(text)
+
+
+def parse_assignment(text):
+    name, sep, value = text.partition('=')
+    if not sep or name not in TUNABLES:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE with NAME one of {', '.join(TUNABLES)}")
+    return name, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate balance constants with headless rollouts')
+    parser.add_argument('--episodes', type=int, default=10000, help='Episodes per set of constants')
+    parser.add_argument('--set', type=parse_assignment, action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a constant for every run')
+    parser.add_argument('--sweep', type=parse_assignment, action='append', default=[], metavar='NAME=V1,V2,...',
+                        help='Try each value of a constant; several sweeps run every combination')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='autopilot', help='Who plays')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes')
+    parser.add_argument('--lanes', type=int, default=1024, help='Games simulated side by side per worker')
+    parser.add_argument('--max-frames', type=int, default=36000, help='Cut episodes off after this many steps')
+    parser.add_argument('--seed', type=int, default=0, help='Seed; results do not depend on --workers')
+    parser.add_argument('--output', metavar='FILE.npz', help='Save every episode of every run')
+    args = parser.parse_args()
+    for name in ('episodes', 'workers', 'lanes', 'max_frames'):
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name.replace('_', '-')} must be positive")
+
+    fixed = {name: parse_value(value) for name, value in args.set}
+    sweep_names = [name for name, _ in args.sweep]
+    sweep_values = [[parse_value(v) for v in values.split(',')] for _, values in args.sweep]
+
+    saved = {}
+    for combination in itertools.product(*sweep_values):
+        overrides = dict(fixed, **dict(zip(sweep_names, combination)))
+        tuning = Tuning(**overrides)
+
+        start = time.perf_counter()
+        results = run_rollouts(args.episodes, tuning, POLICIES[args.policy](), args.workers,
+                               args.seed, args.lanes, args.max_frames)
+        elapsed = time.perf_counter() - start
+
+        summary = summarize(results)
+        label = ", ".join(f"{name}={value}" for name, value in overrides.items()) or "defaults"
+        print(f"{label}: mean score {summary['mean_score']:.2f}, median {summary['median_score']:.0f}, "
+              f"p90 {summary['p90_score']:.0f}, max {summary['max_score']}, "
+              f"mean steps {summary['mean_frames']:.0f}")
+        print("    deaths: " + ", ".join(f"{key[:-6]} {value:.1%}" for key, value in summary.items()
+                                         if key.endswith('_share')) +
+              f"  ({args.episodes / elapsed:.0f} episodes/s)")
+        saved[label] = results
+
+    if args.output:
+        np.savez_compressed(args.output, **saved)
+
+
+if __name__ == '__main__':
+    main()
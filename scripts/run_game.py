@@ -15,7 +15,11 @@ def main():
     parser.add_argument('--show-hitboxes', action='store_true', 
                       help='Show collision hitboxes')
     parser.add_argument('--debug', action='store_true',
-                      help='Enable debug mode with additional logging')
+                      help='Time each phase of every frame, show an overlay and write a trace on exit')
+    parser.add_argument('--profile', action='store_true',
+                      help='Same as --debug')
+    parser.add_argument('--trace', metavar='FILE', default=None,
+                      help='Where to write the frame trace (default: frame_trace.json)')
     args = parser.parse_args()
 
     # Get the root directory of the project
@@ -30,6 +34,10 @@ def main():
     # Add any command line arguments
     if args.show_hitboxes:
         cmd.append('--show-hitboxes')
+    if args.debug or args.profile:
+        cmd.append('--profile')
+    if args.trace:
+        cmd.extend(['--trace', os.path.abspath(args.trace)])
     
     try:
         # Run the game module
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Summarize where players die, from telemetry logs written by
+`src.main --telemetry`.
+
+    python scripts/telemetry_report.py telemetry.fbtl [more logs or dirs ...]
+
+Prints how many rounds ended of each cause, the score and pipe position
+they ended at, and for pipe deaths whether the bird was above or below
+the gap.
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.utils.constants import *
+from src.core.batch import DEATH_CAUSES, DEATH_PIPE
+from src.core.telemetry import TELEMETRY_EXTENSION, read_telemetry
+
+
+def find_logs(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names if name.endswith(TELEMETRY_EXTENSION))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize where players die from telemetry logs')
+    parser.add_argument('paths', nargs='+', help=f'Telemetry logs, or directories of *{TELEMETRY_EXTENSION} files')
+    args = parser.parse_args()
+
+    logs = [read_telemetry(path) for path in find_logs(args.paths)]
+    if not logs:
+        parser.error("No telemetry logs found")
+    steps = sum(len(log) for log in logs)
+    deaths = np.concatenate([log[log['death_cause'] > 0] for log in logs])
+    print(f"{steps} steps, {len(deaths)} rounds ended")
+    if not len(deaths):
+        return
+
+    print(f"{'cause':10s} {'rounds':>8s} {'share':>7s} {'mean score':>11s} {'mean step':>10s}")
+    for code in range(1, len(DEATH_CAUSES)):
+        ended = deaths[deaths['death_cause'] == code]
+        if not len(ended):
+            continue
+        print(f"{DEATH_CAUSES[code]:10s} {len(ended):8d} {len(ended) / len(deaths):7.1%} "
+              f"{ended['score'].mean():11.2f} {ended['frame'].mean():10.1f}")
+
+    pipe = deaths[deaths['death_cause'] == DEATH_PIPE]
+    if len(pipe):
+        # Bird center relative to the gap center; positive is below it
+        offset = pipe['bird_y'] + BIRD_SIZE / 2 - pipe['gap_y']
+        entering = pipe['obstacle_x'] > pipe['bird_x']
+        print()
+        print(f"Pipe deaths: {np.mean(offset < 0):.1%} above the gap center, {np.mean(offset >= 0):.1%} below; "
+              f"median offset {np.median(offset):+.1f} px")
+        print(f"{np.mean(entering):.1%} hit the pipe on the way in, {np.mean(~entering):.1%} inside the gap")
+
+
+if __name__ == '__main__':
+    main()
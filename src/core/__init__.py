@@ -0,0 +1,4 @@
+"""
+Headless simulation core.
+Contains the game rules and physics, free of any pygame dependency.
+"""
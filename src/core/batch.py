@@ -0,0 +1,323 @@
+import numpy as np
+from src.utils.constants import *
+from src.core.game import BirdState, ObstacleState, GameState, PLAYING
+from src.core.tuning import Tuning
+
+# Death causes, stored as small integer codes in BatchGame.death_cause
+NO_DEATH = 0
+DEATH_PIPE = 1
+DEATH_GROUND = 2
+DEATH_CEILING = 3
+DEATH_CAUSES = (None, "pipe", "ground", "ceiling")
+
+
+def ellipse_rects_overlap(cx, cy, radius_x, radius_y, cos_angle, sin_angle,
+                          left, top, right, bottom):
+    """
+    Vectorized src.core.collision.ellipse_rect_overlap. Arguments broadcast,
+    so one bird can be tested against many rects or many birds against one.
+    """
+    inside = (left <= cx) & (cx <= right) & (top <= cy) & (cy <= bottom)
+
+    dx = left - cx
+    dy = top - cy
+    ax = (dx * cos_angle + dy * sin_angle) / radius_x
+    ay = (-dx * sin_angle + dy * cos_angle) / radius_y
+    width = right - left
+    height = bottom - top
+    ux = width * cos_angle / radius_x
+    uy = -width * sin_angle / radius_y
+    vx = height * sin_angle / radius_x
+    vy = height * cos_angle / radius_y
+
+    return (inside |
+            _segments_within_unit(ax, ay, ux, uy) |
+            _segments_within_unit(ax + vx, ay + vy, ux, uy) |
+            _segments_within_unit(ax, ay, vx, vy) |
+            _segments_within_unit(ax + ux, ay + uy, vx, vy))
+
+
+def _segments_within_unit(px, py, dx, dy):
+    length_sq = dx * dx + dy * dy
+    safe_length_sq = np.where(length_sq > 0, length_sq, 1.0)
+    t = np.clip(-(px * dx + py * dy) / safe_length_sq, 0.0, 1.0)
+    nx = px + t * dx
+    ny = py + t * dy
+    return nx * nx + ny * ny <= 1
+
+
+class BatchGame:
+    """
+    N independent games in struct-of-arrays form.
+
+    Every game is always "playing": step() advances all live games at once
+    with the same physics as BirdState.update, ObstacleState.update and
+    GameState.update. Finished games stay frozen until reset().
+
+    A Tuning (src.core.tuning) replaces the balance constants, so changes
+    to them can be evaluated without touching src.utils.constants.
+    """
+
+    def __init__(self, n, seed=None, gap_rngs=None, tuning=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+
+        # Balance constants; the defaults match GameState
+        self.tuning = tuning if tuning is not None else Tuning()
+        self.max_obstacles = self.tuning.max_obstacles
+
+        # Optional per-game random.Random streams; gaps are then drawn from
+        # them exactly as GameState.spawn_obstacle would, one game at a time
+        self.gap_rngs = gap_rngs
+
+        template = BirdState()
+        self.bird_x = float(template.x)
+        self.start_y = float(template.y)
+        self.hitbox_width = template.hitbox_width
+        self.hitbox_height = template.hitbox_height
+        self.cap_height = ObstacleState(0, 0).cap_height
+
+        # Bird state
+        self.y = np.zeros(n)
+        self.velocity = np.zeros(n)
+        self.angle = np.zeros(n)
+
+        # Hitbox trig, computed once per step
+        self._cos = np.ones(n)
+        self._sin = np.zeros(n)
+
+        # Obstacles, oldest first in each row; obs_count says how many are live
+        k = self.max_obstacles
+        self.obs_x = np.zeros((n, k))
+        self.obs_gap_y = np.zeros((n, k))
+        self.obs_passed = np.zeros((n, k), dtype=bool)
+        self.obs_count = np.zeros(n, dtype=np.int64)
+        self._columns = np.arange(k)
+
+        # Per game bookkeeping
+        self.score = np.zeros(n, dtype=np.int64)
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.alive = np.zeros(n, dtype=bool)
+        self.death_cause = np.zeros(n, dtype=np.int8)
+
+        # get_speed_multiplier tabulated by score, grown on demand
+        self._speed_table = np.zeros(0)
+        self._grow_speed_table(64)
+
+        self._rows = np.arange(n)
+        self.reset()
+
+    def _grow_speed_table(self, size):
+        start = len(self._speed_table)
+        extra = [self.tuning.speed_multiplier(score) for score in range(start, size)]
+        self._speed_table = np.concatenate([self._speed_table, extra])
+
+    def speed_multipliers(self, scores):
+        """get_speed_multiplier, with this game's tuning, applied to an array of scores."""
+        return self._speed_table[scores]
+
+    def next_obstacles(self):
+        """
+        GameState.next_obstacle for every game, as (found, x, gap_y) arrays.
+        x and gap_y are meaningless where found is False.
+        """
+        ahead = (self.obs_x + OBSTACLE_WIDTH > self.bird_x) & (self._columns < self.obs_count[:, None])
+        column = np.argmax(ahead, axis=1)
+        return ahead.any(axis=1), self.obs_x[self._rows, column], self.obs_gap_y[self._rows, column]
+
+    def reset(self, mask=None):
+        """Restart every game, or only the games selected by a boolean mask."""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
+        self.y[mask] = self.start_y
+        self.velocity[mask] = 0
+        self.angle[mask] = 0
+        self.obs_count[mask] = 0
+        self.obs_passed[mask] = False
+        self.score[mask] = 0
+        self.frames[mask] = 0
+        self.alive[mask] = True
+        self.death_cause[mask] = NO_DEATH
+
+    def take(self, rows):
+        """
+        Keep only the games in rows, in that order. Every step costs the
+        same per game whether it is live or not, so dropping finished games
+        makes the rest cheaper to step.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        self.n = len(rows)
+        for name in ('y', 'velocity', 'angle', '_cos', '_sin', 'obs_x', 'obs_gap_y', 'obs_passed',
+                     'obs_count', 'score', 'frames', 'alive', 'death_cause'):
+            setattr(self, name, getattr(self, name)[rows])
+        if self.gap_rngs is not None:
+            self.gap_rngs = [self.gap_rngs[row] for row in rows]
+        self._rows = np.arange(self.n)
+
+    def to_game_state(self, row, rng=None):
+        """
+        A GameState that continues live game row exactly where it is, e.g. to
+        finish a few long games without paying for a step of the whole batch.
+        GameState only plays the default constants, so the batch must too.
+        """
+        if self.tuning.overrides:
+            raise ValueError(f"Cannot continue a game of {self.tuning!r} as a GameState")
+        game = GameState(rng=rng)
+        game.game_state = PLAYING
+        game.score = int(self.score[row])
+        game.frame = int(self.frames[row])
+
+        bird = game.bird
+        bird.x = self.bird_x
+        bird.y = float(self.y[row])
+        bird.velocity = float(self.velocity[row])
+        bird.angle = float(self.angle[row])
+        bird.score = game.score
+
+        for j in range(self.obs_count[row]):
+            obs = game.obstacles.spawn(float(self.obs_x[row, j]), int(self.obs_gap_y[row, j]), game.score)
+            obs.passed = bool(self.obs_passed[row, j])
+        return game
+
+    def _rect_hits(self, rows, left, top, width, height):
+        # Vectorized BirdState.collides_with_rect for the birds in rows
+        cx = self.bird_x + BIRD_SIZE // 2
+        cy = self.y[rows] + BIRD_SIZE // 2
+        right = left + width
+        bottom = top + height
+
+        # Only rects touching the box around the hitbox can overlap the ellipse
+        reach = max(self.hitbox_width, self.hitbox_height) / 2
+        hits = ((left <= cx + reach) & (right >= cx - reach) &
+                (top <= cy + reach) & (bottom >= cy - reach))
+        near = np.flatnonzero(hits)
+        if len(near):
+            near_rows = rows[near]
+            hits[near] = ellipse_rects_overlap(
+                cx, cy[near], self.hitbox_width / 2, self.hitbox_height / 2,
+                self._cos[near_rows], self._sin[near_rows],
+                left[near], top[near], right[near], bottom[near]
+            )
+        return hits
+
+    def _world_hits(self, rows, left, top, width, height):
+        count = len(rows)
+        return self._rect_hits(
+            rows,
+            np.full(count, float(left)), np.full(count, float(top)),
+            np.full(count, float(width)), np.full(count, float(height))
+        )
+
+    def step(self, actions, dt=1 / 60):
+        """
+        Flap the games where actions is truthy, then advance every live game
+        by dt seconds. Returns a boolean mask of games that died this step.
+        """
+        alive = self.alive.copy()
+        died = np.zeros(self.n, dtype=bool)
+        if not alive.any():
+            return died
+
+        flap = alive & np.asarray(actions, dtype=bool)
+        tuning = self.tuning
+        self.velocity[flap] = -tuning.flap_strength
+
+        # Scores rise at most once per pipe per step
+        needed = int(self.score.max()) + self.max_obstacles + 1
+        if needed > len(self._speed_table):
+            self._grow_speed_table(2 * needed)
+
+        # Bird physics, as in BirdState.update
+        prev_y = self.y.copy()
+        scaled_dt = dt * self.speed_multipliers(self.score)
+        velocity = np.minimum(self.velocity + tuning.gravity * scaled_dt, tuning.max_fall_speed)
+        y = self.y + velocity * scaled_dt
+        target_angle = np.clip(velocity * 0.2, -30, 90)
+        angle = self.angle + (target_angle - self.angle) * scaled_dt * 10
+        self.velocity = np.where(alive, velocity, self.velocity)
+        self.y = np.where(alive, y, self.y)
+        self.angle = np.where(alive, angle, self.angle)
+
+        # The hitbox is rotated by -angle, like the sprite
+        angle_rad = np.radians(-self.angle)
+        self._cos = np.cos(angle_rad)
+        self._sin = np.sin(angle_rad)
+
+        # Spawn obstacles
+        count = self.obs_count
+        last_x = self.obs_x[self._rows, np.maximum(count - 1, 0)]
+        spawn = alive & ((count == 0) | (last_x < WIDTH - tuning.spacing)) & (count < self.max_obstacles)
+        spawn_rows = np.flatnonzero(spawn)
+        if len(spawn_rows):
+            slots = count[spawn_rows]
+            self.obs_x[spawn_rows, slots] = WIDTH
+            if self.gap_rngs is None:
+                gap_y = self.rng.integers(tuning.gap_y_min, tuning.gap_y_max + 1, len(spawn_rows))
+            else:
+                gap_y = [self.gap_rngs[row].randint(tuning.gap_y_min, tuning.gap_y_max) for row in spawn_rows]
+            self.obs_gap_y[spawn_rows, slots] = gap_y
+            self.obs_passed[spawn_rows, slots] = False
+            count[spawn_rows] += 1
+
+        # Update obstacles in list order, so a score earned on one pipe
+        # speeds up the pipes behind it within the same step
+        hit_pipe = np.zeros(self.n, dtype=bool)
+        removed = np.zeros((self.n, self.max_obstacles), dtype=bool)
+        for j in range(self.max_obstacles):
+            active = alive & ~hit_pipe & (j < count)
+            if not active.any():
+                break
+            speed = tuning.base_obstacle_speed * self.speed_multipliers(self.score) * dt
+            x = np.where(active, self.obs_x[:, j] - speed, self.obs_x[:, j])
+            self.obs_x[:, j] = x
+
+            # Check for score
+            scored = active & (x < self.bird_x) & ~self.obs_passed[:, j]
+            self.obs_passed[scored, j] = True
+            self.score[scored] += 1
+
+            # Remove if off screen
+            gone = active & (x < -OBSTACLE_WIDTH)
+            removed[:, j] = gone
+
+            # Collision detection against both pipes
+            rows = np.flatnonzero(active & ~gone)
+            if len(rows):
+                left = np.trunc(x[rows])
+                gap_y = self.obs_gap_y[rows, j]
+                width = np.full(len(rows), float(OBSTACLE_WIDTH))
+                top_height = np.trunc(gap_y - tuning.gap_height / 2 + self.cap_height)
+                bottom_top = np.trunc(gap_y + tuning.gap_height / 2 - self.cap_height)
+                bottom_height = np.trunc(HEIGHT - (gap_y + tuning.gap_height / 2 - self.cap_height))
+                hits = (self._rect_hits(rows, left, np.zeros(len(rows)), width, top_height) |
+                        self._rect_hits(rows, left, bottom_top, width, bottom_height))
+                hit_pipe[rows[hits]] = True
+
+        # Bird x never moves, so only y is pulled back on a pipe hit
+        self.y[hit_pipe] = prev_y[hit_pipe] * 0.5 + self.y[hit_pipe] * 0.5
+        self.death_cause[hit_pipe] = DEATH_PIPE
+        died |= hit_pipe
+
+        # Drop pipes that left the screen, keeping the rest in order
+        compact = np.flatnonzero(removed.any(axis=1))
+        if len(compact):
+            order = np.argsort(removed[compact], axis=1, kind='stable')
+            for arr in (self.obs_x, self.obs_gap_y, self.obs_passed):
+                arr[compact] = np.take_along_axis(arr[compact], order, axis=1)
+            count[compact] -= removed[compact].sum(axis=1)
+
+        # Ground and ceiling collision
+        rows = np.flatnonzero(alive)
+        ground = self._world_hits(rows, 0, HEIGHT - GROUND_HEIGHT, WIDTH, GROUND_HEIGHT)
+        ceiling = self._world_hits(rows, 0, -GROUND_HEIGHT, WIDTH, GROUND_HEIGHT) & ~ground
+        for hit, cause in ((rows[ground], DEATH_GROUND), (rows[ceiling], DEATH_CEILING)):
+            self.y[hit] = prev_y[hit] * 0.5 + self.y[hit] * 0.5
+            self.velocity[hit] = 0
+            self.death_cause[hit] = np.where(
+                self.death_cause[hit] == NO_DEATH, cause, self.death_cause[hit])
+            died[hit] = True
+
+        self.frames[alive] += 1
+        self.alive &= ~died
+        return died
@@ -0,0 +1,13 @@
+from src.utils.constants import *
+
+
+def obstacle_span(obs):
+    # Horizontal extent of both pipes, truncated like ObstacleState.get_rects
+    left = int(obs.x)
+    return left, left + OBSTACLE_WIDTH
+
+
+def aabb_overlaps_rect(aabb, rect):
+    left, top, right, bottom = aabb
+    return left <= rect.right and rect.left <= right and top <= rect.bottom and rect.top <= bottom
+
@@ -0,0 +1,51 @@
+import math
+
+
+def hitbox_trig(angle_deg):
+    """cos and sin of a hitbox rotation, to be computed once and reused."""
+    angle_rad = math.radians(angle_deg)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
+def ellipse_rect_overlap(cx, cy, radius_x, radius_y, cos_angle, sin_angle,
+                         left, top, right, bottom):
+    """
+    Exact test between a rotated ellipse and a closed axis-aligned rect.
+
+    The rect is mapped into the ellipse's rotated frame and scaled so the
+    ellipse becomes the unit circle. The rect becomes a parallelogram, and
+    the two overlap when the circle center lies inside it or the closest
+    point of one of its edges is within distance 1.
+    """
+    # Ellipse center inside the rect
+    if left <= cx <= right and top <= cy <= bottom:
+        return True
+
+    # Corner (left, top) and the two edge vectors in the unit circle frame
+    dx = left - cx
+    dy = top - cy
+    ax = (dx * cos_angle + dy * sin_angle) / radius_x
+    ay = (-dx * sin_angle + dy * cos_angle) / radius_y
+    width = right - left
+    height = bottom - top
+    ux = width * cos_angle / radius_x
+    uy = -width * sin_angle / radius_y
+    vx = height * sin_angle / radius_x
+    vy = height * cos_angle / radius_y
+
+    # Top, bottom, left and right edges as (start, direction)
+    return (_segment_within_unit(ax, ay, ux, uy) or
+            _segment_within_unit(ax + vx, ay + vy, ux, uy) or
+            _segment_within_unit(ax, ay, vx, vy) or
+            _segment_within_unit(ax + ux, ay + uy, vx, vy))
+
+
+def _segment_within_unit(px, py, dx, dy):
+    # Closest point of the segment p + t*d (0 <= t <= 1) to the origin
+    length_sq = dx * dx + dy * dy
+    t = 0.0
+    if length_sq > 0:
+        t = min(max(-(px * dx + py * dy) / length_sq, 0.0), 1.0)
+    nx = px + t * dx
+    ny = py + t * dy
+    return nx * nx + ny * ny <= 1
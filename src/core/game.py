@@ -0,0 +1,414 @@
+import copy
+import math
+import random
+from src.utils.constants import *
+from src.core.rect import Rect
+from src.core.collision import hitbox_trig, ellipse_rect_overlap
+from src.core.broadphase import aabb_overlaps_rect
+from src.core.obstacles import ObstacleField
+
+# Game states
+START = "start"
+PLAYING = "playing"
+GAME_OVER = "game_over"
+
+# Fraction of the last move that is undone when the bird hits something
+COLLISION_INTERPOLATION = 0.5
+
+# Static world bounds, built once
+GROUND_RECT = Rect(0, HEIGHT - GROUND_HEIGHT, WIDTH, GROUND_HEIGHT)
+CEILING_RECT = Rect(0, -GROUND_HEIGHT, WIDTH, GROUND_HEIGHT)
+
+
+class BirdState:
+    """Bird physics and hitbox, with no rendering attached."""
+
+    def __init__(self):
+        self.x = 200
+        self.y = HEIGHT // 2
+        self.velocity = 0
+        self.frame = 0
+        self.animation_time = 0
+        self.angle = 0
+        self.score = 0  # Track score for speed scaling
+
+        # Recent positions, used by the renderer for the motion trail
+        self.motion_trail = []
+
+        # Elliptical hitbox parameters
+        self.hitbox_width = int(BIRD_SIZE * 0.6)  # Width of ellipse
+        self.hitbox_height = int(BIRD_SIZE * 0.5)  # Height of ellipse
+        self.hitbox_offset_x = (BIRD_SIZE - self.hitbox_width) // 2
+        self.hitbox_offset_y = (BIRD_SIZE - self.hitbox_height) // 2
+
+        # Hitbox trig, recomputed only when the angle changes
+        self._trig_angle = None
+        self._trig = (1.0, 0.0)
+
+    def get_rotated_position(self, x, y, cx, cy, angle_deg):
+        # Convert angle to radians
+        angle_rad = math.radians(angle_deg)
+        cos_angle = math.cos(angle_rad)
+        sin_angle = math.sin(angle_rad)
+
+        # Translate point to origin
+        dx = x - cx
+        dy = y - cy
+
+        # Rotate point
+        new_x = dx * cos_angle - dy * sin_angle + cx
+        new_y = dx * sin_angle + dy * cos_angle + cy
+
+        return new_x, new_y
+
+    def get_hitbox_center(self):
+        # Calculate the center of the sprite
+        sprite_center_x = self.x + BIRD_SIZE // 2
+        sprite_center_y = self.y + BIRD_SIZE // 2
+
+        # Calculate the offset from sprite center to hitbox center
+        offset_x = 0  # No horizontal offset needed as hitbox is centered
+        offset_y = 0  # No vertical offset needed as hitbox is centered
+
+        # Apply rotation to the offset
+        final_x, final_y = self.get_rotated_position(
+            sprite_center_x + offset_x,
+            sprite_center_y + offset_y,
+            sprite_center_x,
+            sprite_center_y,
+            -self.angle
+        )
+
+        return (final_x, final_y)
+
+    def point_in_ellipse(self, point, center, width, height, angle_deg):
+        # Convert angle to radians
+        angle_rad = math.radians(angle_deg)
+        cos_angle = math.cos(angle_rad)
+        sin_angle = math.sin(angle_rad)
+
+        # Translate point to origin
+        dx = point[0] - center[0]
+        dy = point[1] - center[1]
+
+        # Rotate point
+        x_rot = dx * cos_angle + dy * sin_angle
+        y_rot = -dx * sin_angle + dy * cos_angle
+
+        # Scale to unit circle
+        x_scaled = x_rot / (width / 2)
+        y_scaled = y_rot / (height / 2)
+
+        # Check if point is inside ellipse
+        return (x_scaled * x_scaled + y_scaled * y_scaled) <= 1
+
+    def get_hitbox_trig(self):
+        # The hitbox is rotated by -angle, like the sprite
+        if self._trig_angle != self.angle:
+            self._trig = hitbox_trig(-self.angle)
+            self._trig_angle = self.angle
+        return self._trig
+
+    def get_hitbox_aabb(self):
+        """Axis-aligned bounds of the rotated hitbox as (left, top, right, bottom)."""
+        cos_angle, sin_angle = self.get_hitbox_trig()
+        radius_x = self.hitbox_width / 2
+        radius_y = self.hitbox_height / 2
+        half_width = math.hypot(radius_x * cos_angle, radius_y * sin_angle)
+        half_height = math.hypot(radius_x * sin_angle, radius_y * cos_angle)
+        cx = self.x + BIRD_SIZE // 2
+        cy = self.y + BIRD_SIZE // 2
+        return (cx - half_width, cy - half_height, cx + half_width, cy + half_height)
+
+    def collides_with_rect(self, rect):
+        # The hitbox is centered on the sprite, so rotation leaves the center in place
+        cos_angle, sin_angle = self.get_hitbox_trig()
+        return ellipse_rect_overlap(
+            self.x + BIRD_SIZE // 2, self.y + BIRD_SIZE // 2,
+            self.hitbox_width / 2, self.hitbox_height / 2,
+            cos_angle, sin_angle,
+            rect.left, rect.top, rect.right, rect.bottom
+        )
+
+    def collides_with_rects(self, rects):
+        """Test the hitbox against many rects, sharing one trig evaluation."""
+        cos_angle, sin_angle = self.get_hitbox_trig()
+        cx = self.x + BIRD_SIZE // 2
+        cy = self.y + BIRD_SIZE // 2
+        radius_x = self.hitbox_width / 2
+        radius_y = self.hitbox_height / 2
+        for rect in rects:
+            if ellipse_rect_overlap(cx, cy, radius_x, radius_y, cos_angle, sin_angle,
+                                    rect.left, rect.top, rect.right, rect.bottom):
+                return True
+        return False
+
+    def collides_with_rect_sampled(self, rect):
+        # Previous approximate test, kept as a reference for scripts/bench_collision.py
+        # Get hitbox parameters
+        center = self.get_hitbox_center()
+
+        # Check multiple points along each edge of the rectangle
+        num_points = 8  # Number of points to check on each edge
+
+        # Top edge points
+        for i in range(num_points):
+            x = rect.left + (rect.width * i / (num_points - 1))
+            point = (x, rect.top)
+            if self.point_in_ellipse(point, center, self.hitbox_width, self.hitbox_height, -self.angle):
+                return True
+
+        # Bottom edge points
+        for i in range(num_points):
+            x = rect.left + (rect.width * i / (num_points - 1))
+            point = (x, rect.bottom)
+            if self.point_in_ellipse(point, center, self.hitbox_width, self.hitbox_height, -self.angle):
+                return True
+
+        # Left edge points
+        for i in range(num_points):
+            y = rect.top + (rect.height * i / (num_points - 1))
+            point = (rect.left, y)
+            if self.point_in_ellipse(point, center, self.hitbox_width, self.hitbox_height, -self.angle):
+                return True
+
+        # Right edge points
+        for i in range(num_points):
+            y = rect.top + (rect.height * i / (num_points - 1))
+            point = (rect.right, y)
+            if self.point_in_ellipse(point, center, self.hitbox_width, self.hitbox_height, -self.angle):
+                return True
+
+        # Check if the center of the bird is inside the rectangle
+        bird_center = self.get_hitbox_center()
+        if rect.collidepoint(bird_center):
+            return True
+
+        return False
+
+    def flap(self):
+        # Flap strength remains constant regardless of speed
+        self.velocity = -FLAP_STRENGTH
+
+    def update(self, dt, score=None):
+        if score is not None:
+            self.score = score
+
+        # Get current speed multiplier
+        speed_multiplier = get_speed_multiplier(self.score)
+
+        # Scale the time delta instead of the physics values
+        # This makes the bird move through the same arc faster without changing the arc itself
+        scaled_dt = dt * speed_multiplier
+
+        # Apply gravity with constant values (unscaled)
+        self.velocity = min(self.velocity + GRAVITY * scaled_dt, MAX_FALL_SPEED)
+        self.y += self.velocity * scaled_dt
+
+        # Update animation (modified for 2 frames instead of 3)
+        self.animation_time += dt
+        if self.animation_time > 0.1:
+            self.frame = (self.frame + 1) % 2
+            self.animation_time = 0
+
+        # Update rotation based on velocity
+        target_angle = max(-30, min(self.velocity * 0.2, 90))
+        self.angle += (target_angle - self.angle) * scaled_dt * 10
+
+        # Update motion trail with centered positions
+        self.motion_trail.append((self.x, self.y))
+        if len(self.motion_trail) > 5:
+            self.motion_trail.pop(0)
+
+    def snapshot(self):
+        """A copy of this bird that later updates leave alone, for drawing on another thread."""
+        view = copy.copy(self)
+        view.motion_trail = list(self.motion_trail)
+        return view
+
+
+class ObstacleState:
+    """A pair of pipes sharing one gap, with no rendering attached."""
+
+    def __init__(self, x, gap_y, score=0):
+        # Store cap height for hitbox calculations
+        self.cap_height = 30
+        self.respawn(x, gap_y, score)
+
+    def respawn(self, x, gap_y, score=0):
+        """Reset this record for a new pipe pair; ObstacleField recycles records."""
+        self.x = x
+        self.gap_y = gap_y
+        self.passed = False
+        self.score = score
+
+    def update(self, dt, score=None):
+        if score is not None:
+            self.score = score
+        speed_multiplier = get_speed_multiplier(self.score)
+        self.x -= BASE_OBSTACLE_SPEED * speed_multiplier * dt
+
+    def snapshot(self):
+        # Records are recycled, so the copy is what stays fixed
+        return copy.copy(self)
+
+    def get_rects(self):
+        # Return full-size rectangles for accurate collision detection
+        # Top pipe: Include the cap at the bottom
+        top_rect = Rect(
+            self.x,
+            0,
+            OBSTACLE_WIDTH,
+            self.gap_y - GAP_HEIGHT/2 + self.cap_height  # Extended to include cap
+        )
+
+        # Bottom pipe: Include the cap at the top
+        bottom_rect = Rect(
+            self.x,
+            self.gap_y + GAP_HEIGHT/2 - self.cap_height,  # Start higher to include cap
+            OBSTACLE_WIDTH,
+            HEIGHT - (self.gap_y + GAP_HEIGHT/2 - self.cap_height)
+        )
+        return top_rect, bottom_rect
+
+
+class GameSnapshot:
+    """
+    What drawing a GameState needs, frozen at one moment: game_state, score,
+    and copies of the bird and the live pipes. Nothing changes it after it
+    is taken, so one thread can draw it while another steps the game on.
+    """
+
+    def __init__(self, game):
+        self.game_state = game.game_state
+        self.score = game.score
+        self.frame = game.frame
+        self.death_cause = game.death_cause
+        self.bird = game.bird.snapshot()
+        self.obstacles = tuple(obs.snapshot() for obs in game.obstacles)
+
+
+class GameState:
+    """
+    The full set of game rules: spawning, scoring, collisions, speed scaling
+    and game_state transitions. Runs without a display, so it can be stepped
+    as fast as the CPU allows.
+
+    bird_factory and obstacle_factory let a renderer substitute its own
+    subclasses of BirdState and ObstacleState (see src.entities). When
+    profiler is set (see src.core.profiler), update() reports its phases
+    to it.
+    """
+
+    def __init__(self, rng=None, bird_factory=BirdState, obstacle_factory=ObstacleState, profiler=None):
+        self.rng = rng if rng is not None else random
+        self.bird_factory = bird_factory
+        self.obstacle_factory = obstacle_factory
+        self.profiler = profiler
+        # Live pipes, oldest first, in recycled records
+        self.obstacles = ObstacleField(obstacle_factory)
+        self.game_state = START
+        self.reset()
+
+    def reset(self):
+        self.bird = self.bird_factory()
+        self.obstacles.clear()
+        self.score = 0
+        self.frame = 0
+        self.death_cause = None
+
+    def start(self):
+        """Begin a fresh round, skipping the start screen."""
+        self.game_state = PLAYING
+        self.reset()
+
+    def press(self):
+        # The single input of the game: start, flap or leave the game-over screen
+        if self.game_state == START:
+            self.start()
+        elif self.game_state == PLAYING:
+            self.bird.flap()
+        elif self.game_state == GAME_OVER:
+            self.game_state = START
+
+    def step(self, action, dt=1 / 60):
+        """Apply one input (truthy to press) and advance the simulation by dt seconds."""
+        if action:
+            self.press()
+        self.update(dt)
+        return self.game_state
+
+    def snapshot(self):
+        return GameSnapshot(self)
+
+    def next_obstacle(self):
+        """The first pipe the bird has not cleared yet, or None before one spawns."""
+        bird_x = self.bird.x
+        for obs in self.obstacles:
+            if obs.x + OBSTACLE_WIDTH > bird_x:
+                return obs
+        return None
+
+    def spawn_obstacle(self):
+        gap_y = self.rng.randint(GAP_HEIGHT // 2 + 50, HEIGHT - GROUND_HEIGHT - GAP_HEIGHT // 2 - 50)
+        self.obstacles.spawn(WIDTH, gap_y, self.score)
+
+    def game_over(self, cause):
+        self.game_state = GAME_OVER
+        # A pipe hit can be followed by a ground hit in the same frame; keep the first
+        if self.death_cause is None:
+            self.death_cause = cause
+
+    def update(self, dt):
+        if self.game_state != PLAYING:
+            return
+
+        bird = self.bird
+        profiler = self.profiler
+
+        # Store bird's previous position
+        prev_x = bird.x
+        prev_y = bird.y
+
+        bird.update(dt, self.score)
+        aabb = bird.get_hitbox_aabb()
+        aabb_left, _, aabb_right, _ = aabb
+        if profiler is not None:
+            profiler.lap("bird_update")
+
+        # Spawn obstacles
+        obstacles = self.obstacles
+        if obstacles.newest is None or obstacles.newest.x < WIDTH - SPACING:
+            self.spawn_obstacle()
+
+        # Scroll, score and cull the pipes in one pass
+        self.score = obstacles.update(dt, self.score, bird.x)
+        if profiler is not None:
+            profiler.lap("obstacle_update")
+
+        # Broadphase: only pipes overlapping the hitbox horizontally can hit it
+        for obs in obstacles.overlapping(aabb_left, aabb_right):
+            # Collision detection
+            if bird.collides_with_rects(obs.get_rects()):
+                interpolation = COLLISION_INTERPOLATION
+                bird.x = prev_x * interpolation + bird.x * (1 - interpolation)
+                bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
+                self.game_over("pipe")
+                break
+
+        # Ground and ceiling collision; a pipe hit may have moved the bird
+        aabb = bird.get_hitbox_aabb()
+        if aabb_overlaps_rect(aabb, GROUND_RECT) and bird.collides_with_rect(GROUND_RECT):
+            interpolation = COLLISION_INTERPOLATION
+            bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
+            bird.velocity = 0
+            self.game_over("ground")
+        elif aabb_overlaps_rect(aabb, CEILING_RECT) and bird.collides_with_rect(CEILING_RECT):
+            interpolation = COLLISION_INTERPOLATION
+            bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
+            bird.velocity = 0
+            self.game_over("ceiling")
+        if profiler is not None:
+            profiler.lap("collisions")
+
+        self.frame += 1
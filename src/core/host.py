@@ -0,0 +1,238 @@
+import os
+import time
+import struct
+import asyncio
+import numpy as np
+from src.utils.constants import *
+from src.core.game import START, PLAYING, GAME_OVER
+from src.core.batch import BatchGame
+from src.core.rng import RngStreams, make_rng, new_seed
+from src.core.replay import ReplayRecorder, REPLAY_EXTENSION
+
+# Every byte a client sends that equals PRESS is one press of the game's
+# single input, as SPACE is in the game; other bytes are ignored
+PRESS = b"p"
+
+# Sent once to a client when it connects: magic, version, physics hz,
+# session seed and the size of a state frame
+HELLO_MAGIC = b"FBHS"
+HOST_VERSION = 1
+HELLO = struct.Struct("<4sBHQH")
+
+# Codes of the session states in a state frame
+STATES = (START, PLAYING, GAME_OVER)
+
+# Sent to every client after every tick. The last six fields are laid out
+# as src.env.FEATURE_NAMES
+STATE_DTYPE = np.dtype([
+    ('tick', '<u4'),
+    ('frame', '<u4'),  # Physics steps into the round
+    ('score', '<u4'),
+    ('state', 'u1'),  # Index into STATES
+    ('death_cause', 'u1'),  # Index into src.core.batch.DEATH_CAUSES
+    ('bird_y', '<f4'),
+    ('velocity', '<f4'),
+    ('angle', '<f4'),
+    ('next_dx', '<f4'),
+    ('next_gap_y', '<f4'),
+    ('speed_multiplier', '<f4'),
+])
+
+# A client this far behind on reading skips state frames until it catches up
+MAX_PENDING_BYTES = 64 * STATE_DTYPE.itemsize
+
+# Ticks later than this are dropped rather than caught up, as
+# FixedTimestep drops long stalls
+MAX_LAG = 0.25
+
+# Stream for the seeds of successive sessions
+SESSIONS = "sessions"
+
+
+class Session:
+    """One client's game: its lane in the host's BatchGame and its streams."""
+
+    def __init__(self, lane, seed, writer):
+        self.lane = lane
+        self.streams = RngStreams(seed)
+        self.writer = writer
+        self.state = START
+        self.presses = 0  # Received since the last tick
+        self.recorder = ReplayRecorder()
+        self.dropped = 0  # State frames skipped for a slow reader
+
+
+class GameHost:
+    """
+    Many concurrent headless games on one asyncio event loop, each played
+    by a client over a socket.
+
+    Every session is one lane of a shared BatchGame, so a tick is a single
+    batch step for every game at once. Pipe gaps come from each session's
+    gameplay stream, exactly as GameState draws them, so each round
+    matches the rules of the game step for step and can be saved as a
+    replay. Presses received between ticks apply before the next step,
+    the way the game handles a frame's events before its physics.
+
+    run() is the tick loop; serve_tcp() and serve_unix() accept clients.
+    """
+
+    def __init__(self, max_sessions=256, physics_hz=60, seed=None, record_replays=None):
+        if physics_hz <= 0:
+            raise ValueError(f"Physics rate must be positive, got {physics_hz}")
+        self.max_sessions = max_sessions
+        self.hz = physics_hz
+        self.dt = 1 / physics_hz
+        self.seed = new_seed() if seed is None else seed
+        self.session_seeds = make_rng(self.seed, SESSIONS)
+        self.record_replays = record_replays
+
+        self.games = BatchGame(max_sessions, gap_rngs=[None] * max_sessions)
+        self.games.alive[:] = False  # Only lanes in a round are stepped
+        self.free_lanes = list(range(max_sessions - 1, -1, -1))
+        self.sessions = {}  # Lane to Session
+
+        self.states = np.zeros(max_sessions, dtype=np.uint8)
+        self.frames = np.zeros(max_sessions, dtype=STATE_DTYPE)
+        self._rows = self.frames.view(np.uint8).reshape(max_sessions, STATE_DTYPE.itemsize)
+        self._actions = np.zeros(max_sessions, dtype=bool)
+
+        self.tick_count = 0
+        self.tick_seconds = 0.0  # Time spent in tick(), for benchmarks
+        self._stopping = False
+
+    def open_session(self, writer):
+        """Give a new client a lane, or return None when the host is full."""
+        if not self.free_lanes:
+            return None
+        lane = self.free_lanes.pop()
+        session = Session(lane, self.session_seeds.getrandbits(64), writer)
+        self.games.gap_rngs[lane] = session.streams.gameplay
+        self.games.alive[lane] = False
+        self.states[lane] = STATES.index(START)
+        self.sessions[lane] = session
+        writer.write(HELLO.pack(HELLO_MAGIC, HOST_VERSION, self.hz, session.streams.seed,
+                                STATE_DTYPE.itemsize))
+        return session
+
+    def close_session(self, session):
+        del self.sessions[session.lane]
+        self.games.alive[session.lane] = False
+        self.games.gap_rngs[session.lane] = None
+        self.free_lanes.append(session.lane)
+
+    def _press(self, session):
+        # GameState.press for one lane
+        lane = session.lane
+        if session.state == START:
+            round_seed = session.streams.new_round()
+            session.recorder.start(round_seed, self.hz)
+            mask = np.zeros(self.max_sessions, dtype=bool)
+            mask[lane] = True
+            self.games.reset(mask)
+            session.state = PLAYING
+        elif session.state == PLAYING:
+            self._actions[lane] = True
+            session.recorder.flap(int(self.games.frames[lane]))
+        elif session.state == GAME_OVER:
+            session.state = START
+        self.states[lane] = STATES.index(session.state)
+
+    def tick(self):
+        """Apply the presses received since the last tick, step every game and send its state."""
+        start = time.perf_counter()
+        games = self.games
+        self._actions[:] = False
+        for session in self.sessions.values():
+            for _ in range(session.presses):
+                self._press(session)
+            session.presses = 0
+
+        died = games.step(self._actions, self.dt)
+        for lane in np.flatnonzero(died):
+            session = self.sessions[lane]
+            session.state = GAME_OVER
+            self.states[lane] = STATES.index(GAME_OVER)
+            if self.record_replays is not None:
+                replay = session.recorder.finish(int(games.score[lane]), int(games.frames[lane]))
+                replay.save(os.path.join(self.record_replays, f"{replay.seed:016x}{REPLAY_EXTENSION}"))
+
+        self.tick_count += 1
+        self._write_frames()
+        self._send()
+        self.tick_seconds += time.perf_counter() - start
+
+    def _write_frames(self):
+        games = self.games
+        frames = self.frames
+        # Until the first pipe spawns, the next one appears at the right edge
+        has_next, next_x, next_gap_y = games.next_obstacles()
+
+        frames['tick'] = self.tick_count
+        frames['frame'] = games.frames
+        frames['score'] = games.score
+        frames['state'] = self.states
+        frames['death_cause'] = games.death_cause
+        frames['bird_y'] = games.y
+        frames['velocity'] = games.velocity
+        frames['angle'] = games.angle
+        frames['next_dx'] = np.where(has_next, next_x, WIDTH) - games.bird_x
+        frames['next_gap_y'] = np.where(has_next, next_gap_y, HEIGHT // 2)
+        frames['speed_multiplier'] = games.speed_multipliers(games.score)
+
+    def _send(self):
+        rows = self._rows
+        for lane, session in self.sessions.items():
+            transport = session.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > MAX_PENDING_BYTES:
+                session.dropped += 1
+                continue
+            # Copied, since the transport may hold on to what it could not send yet
+            transport.write(rows[lane].tobytes())
+
+    async def run(self):
+        """Tick at the physics rate until stop()."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while not self._stopping:
+            self.tick()
+            next_tick += self.dt
+            delay = next_tick - loop.time()
+            if delay < -MAX_LAG:
+                next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    def stop(self):
+        self._stopping = True
+
+    async def handle_client(self, reader, writer):
+        session = self.open_session(writer)
+        if session is None:
+            writer.close()
+            return
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                session.presses += data.count(PRESS)
+        except ConnectionError:
+            pass
+        finally:
+            self.close_session(session)
+            writer.close()
+
+    async def serve_tcp(self, host="127.0.0.1", port=0):
+        """Accept clients on a TCP port and return the asyncio server."""
+        return await asyncio.start_server(self.handle_client, host, port, backlog=self.max_sessions)
+
+    async def serve_unix(self, path):
+        """Accept clients on a Unix socket and return the asyncio server."""
+        return await asyncio.start_unix_server(self.handle_client, path, backlog=self.max_sessions)
+
+
+def decode_states(data):
+    """State frames received from a host as a STATE_DTYPE array, without copying."""
+    return np.frombuffer(data, dtype=STATE_DTYPE)
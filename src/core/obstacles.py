@@ -0,0 +1,126 @@
+import math
+from src.utils.constants import *
+from src.core.broadphase import obstacle_span
+
+
+def obstacle_capacity(spacing):
+    """
+    Pipes alive at once with this spacing: one per spacing across the
+    screen plus the one leaving it, with one spare.
+    """
+    return math.ceil((WIDTH + OBSTACLE_WIDTH) / spacing) + 2
+
+
+OBSTACLE_CAPACITY = obstacle_capacity(SPACING)
+
+
+class ObstacleField:
+    """
+    The live pipes of one game, oldest first, in a fixed ring of recycled
+    obstacle records.
+
+    Pipes enter on the right and leave on the left in the order they came,
+    so spawning writes the slot after the newest pipe and culling advances
+    past the oldest. Records are created by factory the first time their
+    slot is used and reset with respawn() after that, so a running game
+    allocates nothing per spawn or despawn.
+    """
+
+    def __init__(self, factory, capacity=OBSTACLE_CAPACITY):
+        self.factory = factory
+        self.capacity = capacity
+        self.items = [None] * capacity
+        self.head = 0  # Slot of the oldest pipe
+        self.count = 0
+        self.newest = None  # The last pipe spawned, which decides the next spawn
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        items = self.items
+        capacity = self.capacity
+        slot = self.head
+        for _ in range(self.count):
+            yield items[slot]
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("ObstacleField index out of range")
+        return self.items[(self.head + index) % self.capacity]
+
+    def clear(self):
+        # Records stay in their slots for reuse
+        self.head = 0
+        self.count = 0
+        self.newest = None
+
+    def spawn(self, x, gap_y, score=0):
+        """Add a pipe pair on the right, reusing the record in its slot."""
+        if self.count == self.capacity:
+            raise RuntimeError(f"More than {self.capacity} pipes alive at once")
+        slot = (self.head + self.count) % self.capacity
+        obs = self.items[slot]
+        if obs is None:
+            obs = self.items[slot] = self.factory(x, gap_y, score)
+        else:
+            obs.respawn(x, gap_y, score)
+        self.count += 1
+        self.newest = obs
+        return obs
+
+    def update(self, dt, score, bird_x):
+        """
+        Scroll every pipe, score the ones the bird has passed and cull the
+        ones that left the screen, in one pass. Pipes move in order, each at
+        the speed of the score so far, as they always have. Returns the new
+        score.
+        """
+        items = self.items
+        capacity = self.capacity
+        slot = self.head
+        for _ in range(self.count):
+            obs = items[slot]
+            obs.update(dt, score)
+
+            # Check for score
+            if obs.x < bird_x and not obs.passed:
+                obs.passed = True
+                score += 1
+
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+        # Only the oldest pipes can have left the screen
+        while self.count and items[self.head].x < -OBSTACLE_WIDTH:
+            self.head = (self.head + 1) % capacity
+            self.count -= 1
+        if not self.count:
+            self.newest = None
+        return score
+
+    def overlapping(self, left, right):
+        """
+        Yield the pipes whose horizontal span overlaps [left, right]. Pipes
+        are in x order, so this stops at the first one past right; around
+        the bird that is after the next one or two pipes.
+        """
+        items = self.items
+        capacity = self.capacity
+        slot = self.head
+        for _ in range(self.count):
+            obs = items[slot]
+            obs_left, obs_right = obstacle_span(obs)
+            if obs_left > right:
+                return
+            if obs_right >= left:
+                yield obs
+            slot += 1
+            if slot == capacity:
+                slot = 0
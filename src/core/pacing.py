@@ -0,0 +1,98 @@
+import time
+from collections import deque
+
+# Weight of the newest sample in the running render cost estimate
+RENDER_COST_SMOOTHING = 0.2
+
+
+class FramePacer:
+    """
+    Paces the main loop to a target frame rate and decides each frame
+    whether there is time left to render it.
+
+    wait() sleeps through clock, a pygame.time.Clock, with tick() or, for
+    precision, tick_busy_loop(); fps=0 runs unlimited. Frame times are
+    measured with perf_counter rather than the clock's whole milliseconds.
+
+    Rendering is skipped when the time a frame has used so far plus the
+    expected render cost would overrun the frame budget, so physics and
+    input keep their rate and only drawing falls behind; at most max_skip
+    frames in a row are skipped. The last `history` frames are kept for
+    jitter statistics.
+    """
+
+    def __init__(self, clock, fps=60, busy_loop=False, max_skip=2, history=600):
+        if fps < 0:
+            raise ValueError(f"Frame rate must not be negative, got {fps}")
+        self.clock = clock
+        self.fps = fps
+        self.budget = 1 / fps if fps else None
+        self.tick = clock.tick_busy_loop if busy_loop else clock.tick
+        self.max_skip = max_skip
+
+        self.frame_start = None
+        self.render_start = None
+        self.render_cost = 0.0  # Running estimate, in seconds
+        self.skipped_in_row = 0
+
+        self.frame_times = deque(maxlen=history)
+        self.rendered = deque(maxlen=history)
+        self._rendering = False
+
+    def wait(self):
+        """Wait until the next frame is due and return the time since the last one, in seconds."""
+        # The previous frame ends here; record whether it was drawn
+        if self.frame_start is not None:
+            self.rendered.append(self._rendering)
+        self._rendering = False
+
+        self.tick(self.fps)
+        now = time.perf_counter()
+        frame_time = 0.0 if self.frame_start is None else now - self.frame_start
+        if self.frame_start is not None:
+            self.frame_times.append(frame_time)
+        self.frame_start = now
+        return frame_time
+
+    def should_render(self):
+        """
+        Whether to draw this frame, judged after its physics steps ran. When
+        it returns True the render cost is timed until end_render().
+        """
+        now = time.perf_counter()
+        if (self.budget is not None and self.skipped_in_row < self.max_skip
+                and now - self.frame_start + self.render_cost > self.budget):
+            self.skipped_in_row += 1
+            return False
+        self.skipped_in_row = 0
+        self.render_start = now
+        self._rendering = True
+        return True
+
+    def end_render(self):
+        cost = time.perf_counter() - self.render_start
+        self.render_cost += (cost - self.render_cost) * RENDER_COST_SMOOTHING
+
+    def stats(self):
+        """
+        Frame pacing over the recent frames, in milliseconds: mean frame
+        time, jitter (standard deviation), p99 and max, plus the achieved
+        frame rate and the share of frames whose render was skipped. None
+        before two frames have run.
+        """
+        times = sorted(self.frame_times)
+        count = len(times)
+        if not count:
+            return None
+        mean = sum(times) / count
+        jitter = (sum((t - mean) ** 2 for t in times) / count) ** 0.5
+        skipped = self.rendered.count(False)
+        return {
+            "fps": 1 / mean if mean else 0.0,
+            "mean_ms": mean * 1000,
+            "jitter_ms": jitter * 1000,
+            "p99_ms": times[min(count - 1, int(count * 0.99))] * 1000,
+            "max_ms": times[-1] * 1000,
+            "skipped": skipped / len(self.rendered) if self.rendered else 0.0,
+            "render_ms": self.render_cost * 1000,
+        }
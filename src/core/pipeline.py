@@ -0,0 +1,104 @@
+import time
+import queue
+import threading
+
+
+class SnapshotBuffer:
+    """
+    Double buffer of simulation snapshots, between one writer thread and
+    one reader.
+
+    The writer fills the back slot and then flips it to the front under a
+    lock; the reader takes the front slot under the same lock. Snapshots
+    are never changed after they are published, so a reader can keep
+    drawing one while newer ones arrive.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots = [None, None]
+        self._times = [0.0, 0.0]
+        self._front = 0
+        self.sequence = 0  # Snapshots published so far
+
+    def publish(self, snapshot):
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        self._times[back] = time.perf_counter()
+        with self._lock:
+            self._front = back
+            self.sequence += 1
+
+    def latest(self):
+        """The newest snapshot and the perf_counter time it was published."""
+        with self._lock:
+            front = self._front
+            return self._slots[front], self._times[front]
+
+
+class SimulationThread(threading.Thread):
+    """
+    Runs the fixed timestep simulation on its own thread and publishes a
+    snapshot after every batch of steps, so the main thread can draw one
+    state while the next one is being simulated.
+
+    step(dt) advances the world by one physics step, press() applies the
+    game's one input and snapshot() returns a copy of everything drawing
+    needs. Presses queued with queue_press() from another thread are
+    applied before the next step, as the serial loop handles a frame's
+    events before its steps. An exception ends the thread and is kept in
+    `error` for the main thread to raise.
+    """
+
+    def __init__(self, timestep, step, press, snapshot, buffer=None):
+        super().__init__(name="simulation", daemon=True)
+        self.timestep = timestep
+        self._step = step
+        self._press = press
+        self._snapshot = snapshot
+        self.buffer = buffer if buffer is not None else SnapshotBuffer()
+        self.inputs = queue.SimpleQueue()
+        self.steps = 0  # Physics steps run so far
+        self.error = None
+        self._stopping = threading.Event()
+        # There is always a snapshot to draw, even before the first step
+        self.buffer.publish(snapshot())
+
+    def queue_press(self):
+        self.inputs.put(True)
+
+    def stop(self):
+        self._stopping.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def run(self):
+        try:
+            self._run()
+        except Exception as error:
+            self.error = error
+            raise
+
+    def _run(self):
+        timestep = self.timestep
+        inputs = self.inputs
+        last = time.perf_counter()
+        while not self._stopping.is_set():
+            now = time.perf_counter()
+            steps = timestep.advance(now - last)
+            last = now
+
+            pressed = False
+            while not inputs.empty():
+                inputs.get_nowait()
+                self._press()
+                pressed = True
+
+            for _ in range(steps):
+                self._step(timestep.dt)
+            self.steps += steps
+            if steps or pressed:
+                self.buffer.publish(self._snapshot())
+
+            # Sleep until the next step is due, waking early to stop
+            self._stopping.wait(timestep.dt - timestep.accumulator)
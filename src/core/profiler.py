@@ -0,0 +1,155 @@
+import json
+import time
+import numpy as np
+
+# Phases of one frame of the main loop, in the order they run. "wait" is
+# the frame pacing sleep; the physics phases repeat once per physics step
+PHASES = ("wait", "events", "background_update", "particles_update", "bird_update", "obstacle_update",
+          "collisions", "background_draw", "entity_draw", "hud", "present")
+
+# Values sampled once per frame
+COUNTERS = ("obstacles", "particles", "physics_steps")
+
+
+class FrameProfiler:
+    """
+    Per-phase timings of the main loop, for finding which phase a stutter
+    came from.
+
+    The loop calls begin_frame() at the top of every frame and lap(phase)
+    at the end of each phase; the time since the previous lap is charged
+    to that phase, so a phase that runs several times in a frame adds up.
+    The last `capacity` frames are kept in a ring buffer for percentiles,
+    and the last `span_capacity` laps for export as a Chrome trace.
+    """
+
+    def __init__(self, capacity=600, span_capacity=1 << 16, clock=time.perf_counter):
+        self.clock = clock
+        self.capacity = capacity
+        self.phase_index = {name: i for i, name in enumerate(PHASES)}
+        self.counter_index = {name: i for i, name in enumerate(COUNTERS)}
+
+        # One row per frame; a frame lasts from its begin_frame() to the next
+        self.frame_start = np.zeros(capacity)
+        self.frame_time = np.zeros(capacity)
+        self.phase_times = np.zeros((capacity, len(PHASES)))
+        self.counters = np.zeros((capacity, len(COUNTERS)))
+        self.frames = 0  # Frames completed so far
+
+        # The frame in progress, in plain lists since they change every lap
+        self._phases = [0.0] * len(PHASES)
+        self._counts = [0] * len(COUNTERS)
+        self._start = None
+        self._last = None
+
+        # Individual laps for the trace: phase index, start and end time
+        self.span_capacity = span_capacity
+        self._span_phase = [0] * span_capacity
+        self._span_start = [0.0] * span_capacity
+        self._span_end = [0.0] * span_capacity
+        self.spans = 0  # Laps recorded so far
+
+        self.origin = clock()
+
+    def begin_frame(self):
+        now = self.clock()
+        if self._start is not None:
+            self._end_frame(now)
+        self._start = now
+        self._last = now
+
+    def _end_frame(self, now):
+        row = self.frames % self.capacity
+        self.frame_start[row] = self._start
+        self.frame_time[row] = now - self._start
+        self.phase_times[row] = self._phases
+        self.counters[row] = self._counts
+        self._phases = [0.0] * len(PHASES)
+        self.frames += 1
+
+    def lap(self, phase):
+        """Charge the time since the last lap to phase."""
+        now = self.clock()
+        last = self._last
+        index = self.phase_index[phase]
+        self._phases[index] += now - last
+
+        span = self.spans % self.span_capacity
+        self._span_phase[span] = index
+        self._span_start[span] = last
+        self._span_end[span] = now
+        self.spans += 1
+        self._last = now
+
+    def count(self, name, value):
+        """Record a counter for the frame in progress."""
+        self._counts[self.counter_index[name]] = value
+
+    def _rows(self):
+        # Ring buffer rows of the completed frames, oldest first
+        n = min(self.frames, self.capacity)
+        return np.arange(self.frames - n, self.frames) % self.capacity
+
+    def stats(self):
+        """
+        Frame time percentiles in milliseconds, FPS, and the slowest phase of
+        the worst frame, over the frames in the buffer. None before the
+        first frame completes.
+        """
+        rows = self._rows()
+        if not len(rows):
+            return None
+        times = self.frame_time[rows]
+        p50, p95, p99 = np.percentile(times, [50, 95, 99]) * 1000
+        worst = rows[np.argmax(times)]
+        # The pacing sleep is never the cause of a slow frame
+        phase = 1 + int(np.argmax(self.phase_times[worst, 1:]))
+        return {
+            "fps": len(times) / times.sum(),
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "worst": times.max() * 1000,
+            "worst_phase": PHASES[phase],
+            "worst_phase_ms": self.phase_times[worst, phase] * 1000,
+        }
+
+    def summary(self):
+        """A text table of per-phase percentiles over the frames in the buffer."""
+        rows = self._rows()
+        if not len(rows):
+            return "No frames recorded"
+        lines = [f"{'phase':18s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}"]
+        columns = [(name, self.phase_times[rows, i]) for i, name in enumerate(PHASES)]
+        columns.append(("frame", self.frame_time[rows]))
+        for name, times in columns:
+            p50, p95, p99 = np.percentile(times, [50, 95, 99]) * 1000
+            lines.append(f"{name:18s} {p50:8.3f} {p95:8.3f} {p99:8.3f} {times.max() * 1000:8.3f}")
+        return "\n".join(lines)
+
+    def trace_events(self):
+        """The recorded frames, laps and counters as Chrome trace events."""
+        def us(t):
+            return (t - self.origin) * 1e6
+
+        events = []
+        for row in self._rows():
+            start = self.frame_start[row]
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": us(start), "dur": self.frame_time[row] * 1e6})
+            for i, name in enumerate(COUNTERS):
+                events.append({"name": name, "ph": "C", "pid": 0, "ts": us(start),
+                               "args": {name: int(self.counters[row, i])}})
+
+        n = min(self.spans, self.span_capacity)
+        for i in range(self.spans - n, self.spans):
+            span = i % self.span_capacity
+            start = self._span_start[span]
+            events.append({"name": PHASES[self._span_phase[span]], "cat": "phase", "ph": "X", "pid": 0,
+                           "tid": 0, "ts": us(start), "dur": (self._span_end[span] - start) * 1e6})
+        return events
+
+    def export(self, path):
+        """Write a Chrome trace (chrome://tracing or ui.perfetto.dev) to path."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
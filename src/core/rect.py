@@ -0,0 +1,44 @@
+class Rect:
+    """Minimal integer rectangle mirroring the parts of pygame.Rect the core uses."""
+
+    __slots__ = ('left', 'top', 'width', 'height')
+
+    def __init__(self, left, top, width, height):
+        # pygame.Rect truncates float coordinates, so do the same here
+        self.left = int(left)
+        self.top = int(top)
+        self.width = int(width)
+        self.height = int(height)
+
+    @property
+    def x(self):
+        return self.left
+
+    @property
+    def y(self):
+        return self.top
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+    @property
+    def bottom(self):
+        return self.top + self.height
+
+    def collidepoint(self, point):
+        x, y = int(point[0]), int(point[1])
+        return self.left <= x < self.right and self.top <= y < self.bottom
+
+    def __iter__(self):
+        # Allows passing a core Rect anywhere pygame expects a rect-style sequence
+        return iter((self.left, self.top, self.width, self.height))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.left, self.top, self.width, self.height)[index]
+
+    def __repr__(self):
+        return f"<Rect({self.left}, {self.top}, {self.width}, {self.height})>"
@@ -0,0 +1,216 @@
+import struct
+import numpy as np
+from src.core.game import GameState, PLAYING
+from src.core.batch import BatchGame, DEATH_CAUSES
+from src.core.rng import make_rng, GAMEPLAY
+
+# File layout: header, then the flap frames as delta-encoded varints
+REPLAY_MAGIC = b"FBRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBHQIII")  # magic, version, physics hz, seed, score, frames, flap count
+REPLAY_EXTENSION = ".replay"
+
+# A BatchGame step of a few dozen games costs about as much as this many
+# GameState steps; simulate_batch uses it to decide when to finish the last
+# games one at a time
+BATCH_STEP_COST = 32
+
+
+class ReplayError(ValueError):
+    """Raised for data that is not a valid replay."""
+
+
+class Replay:
+    """
+    One recorded round: the round seed, the physics rate and the physics
+    step at which each flap happened, plus the claimed result. Everything
+    else follows from running the rules again.
+    """
+
+    def __init__(self, seed, hz, flaps, score, frames):
+        self.seed = seed
+        self.hz = hz
+        self.flaps = list(flaps)
+        self.score = score
+        self.frames = frames
+
+    def __repr__(self):
+        return (f"Replay(seed={self.seed}, hz={self.hz}, flaps={len(self.flaps)}, "
+                f"score={self.score}, frames={self.frames})")
+
+    def to_bytes(self):
+        body = bytearray()
+        previous = 0
+        for frame in self.flaps:
+            # Flaps are in order, so the gaps are small and mostly one byte
+            delta = frame - previous
+            previous = frame
+            while delta >= 0x80:
+                body.append(delta & 0x7F | 0x80)
+                delta >>= 7
+            body.append(delta)
+        header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.hz, self.seed,
+                             self.score, self.frames, len(self.flaps))
+        return header + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("Truncated replay header")
+        magic, version, hz, seed, score, frames, count = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+
+        flaps = []
+        frame = 0
+        pos = HEADER.size
+        for _ in range(count):
+            delta = shift = 0
+            while True:
+                if pos >= len(data):
+                    raise ReplayError("Truncated flap list")
+                byte = data[pos]
+                pos += 1
+                delta |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            frame += delta
+            flaps.append(frame)
+        return cls(seed, hz, flaps, score, frames)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Collects the flaps of the round in progress."""
+
+    def __init__(self):
+        self.seed = None
+        self.hz = None
+        self.flaps = []
+
+    def start(self, seed, hz):
+        self.seed = seed
+        self.hz = hz
+        self.flaps = []
+
+    def flap(self, frame):
+        # Several presses before the same step flap only once
+        if not self.flaps or self.flaps[-1] != frame:
+            self.flaps.append(frame)
+
+    def finish(self, score, frames):
+        return Replay(self.seed, self.hz, self.flaps, score, frames)
+
+
+def simulate(replay):
+    """Run a replay through GameState. Returns (score, frames, death_cause)."""
+    game = GameState(rng=make_rng(replay.seed, GAMEPLAY))
+    game.start()
+    return _play_out(game, replay)
+
+
+def _play_out(game, replay):
+    # Run a started game to its end with the replay's flaps
+    dt = 1 / replay.hz
+    flaps = set(replay.flaps)
+    # Stop one step past the claimed end; a round that lasts longer is a mismatch too
+    while game.game_state == PLAYING and game.frame <= replay.frames:
+        game.step(game.frame in flaps, dt)
+    return game.score, game.frame, game.death_cause
+
+
+def simulate_batch(replays, lanes=2048):
+    """
+    Run replays with the same physics rate side by side in a BatchGame of
+    up to lanes games, starting the next replay in a lane as soon as its
+    game ends. Returns a list of (score, frames, death_cause), as
+    simulate() does.
+
+    The longest replays start first, so lanes empty out together at the
+    end. Once every replay has started, finished lanes are dropped, and the
+    last few games are handed over to GameState when that is cheaper.
+    """
+    if not replays:
+        return []
+    hz = replays[0].hz
+    if any(replay.hz != hz for replay in replays):
+        raise ValueError("simulate_batch needs replays with the same physics rate")
+    dt = 1 / hz
+
+    # All flap schedules in one flat array, each ending in a sentinel that
+    # never matches a frame; a per-lane pointer walks its replay's part
+    schedule = []
+    starts = []
+    for replay in replays:
+        starts.append(len(schedule))
+        schedule.extend(sorted(set(replay.flaps)))
+        schedule.append(-1)
+    schedule = np.array(schedule, dtype=np.int64)
+
+    n = min(lanes, len(replays))
+    games = BatchGame(n, gap_rngs=[None] * n)
+    lane_replay = np.full(n, -1, dtype=np.int64)
+    claimed = np.zeros(n, dtype=np.int64)
+    pointer = np.zeros(n, dtype=np.int64)
+    results = [None] * len(replays)
+    pending = sorted(range(len(replays)), key=lambda i: replays[i].frames)
+
+    def load(lane):
+        if not pending:
+            # Nothing left to run; freeze the lane
+            lane_replay[lane] = -1
+            games.alive[lane] = False
+            return
+        index = pending.pop()
+        replay = replays[index]
+        lane_replay[lane] = index
+        claimed[lane] = replay.frames
+        pointer[lane] = starts[index]
+        games.gap_rngs[lane] = make_rng(replay.seed, GAMEPLAY)
+
+    for lane in range(n):
+        load(lane)
+    games.reset()
+
+    while True:
+        running = np.flatnonzero(lane_replay >= 0)
+        if not pending:
+            # A game runs at most one step past its claimed end
+            remaining = claimed[running] + 1 - games.frames[running]
+            if not len(running) or remaining.sum() < remaining.max() * BATCH_STEP_COST:
+                # Stepping the rest on their own is cheaper than batch steps
+                for lane in running:
+                    game = games.to_game_state(lane, games.gap_rngs[lane])
+                    results[lane_replay[lane]] = _play_out(game, replays[lane_replay[lane]])
+                break
+            if len(running) <= n // 2:
+                # Drop the finished lanes
+                games.take(running)
+                lane_replay, claimed, pointer = lane_replay[running], claimed[running], pointer[running]
+                n = len(running)
+
+        flap = schedule[pointer] == games.frames
+        pointer += flap
+        games.step(flap, dt)
+
+        # A game is done when it ends, or one step past its claimed end
+        done = np.flatnonzero((lane_replay >= 0) & (~games.alive | (games.frames > claimed)))
+        if len(done):
+            for lane in done:
+                results[lane_replay[lane]] = (int(games.score[lane]), int(games.frames[lane]),
+                                              DEATH_CAUSES[games.death_cause[lane]])
+                load(lane)
+            restarted = done[lane_replay[done] >= 0]
+            games.reset(np.isin(np.arange(n), restarted))
+    return results
@@ -0,0 +1,42 @@
+import random
+
+# Independent random streams, so drawing more particles or clouds never
+# changes where the pipes go
+GAMEPLAY = "gameplay"  # Pipe gaps; the only stream that affects the outcome
+EFFECTS = "effects"  # Particles
+SCENERY = "scenery"  # Clouds and ground decoration
+ROUNDS = "rounds"  # Seeds for successive rounds
+
+
+def make_rng(seed, stream):
+    """A random.Random for one named stream of a seed, the same on every platform."""
+    return random.Random(f"{seed}:{stream}")
+
+
+def new_seed():
+    """A fresh unpredictable 64-bit seed."""
+    return random.SystemRandom().getrandbits(64)
+
+
+class RngStreams:
+    """
+    Seeded per-subsystem random streams for one session.
+
+    Each round gets its own seed, drawn from the session seed, and the
+    gameplay stream restarts from it. A round can then be reproduced from
+    its seed and inputs alone (see src.core.replay).
+    """
+
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else seed
+        self.effects = make_rng(self.seed, EFFECTS)
+        self.scenery = make_rng(self.seed, SCENERY)
+        self.rounds = make_rng(self.seed, ROUNDS)
+        self.round_seed = None
+        self.gameplay = make_rng(self.seed, GAMEPLAY)
+
+    def new_round(self):
+        """Pick the next round's seed and restart the gameplay stream from it."""
+        self.round_seed = self.rounds.getrandbits(64)
+        self.gameplay.seed(f"{self.round_seed}:{GAMEPLAY}")
+        return self.round_seed
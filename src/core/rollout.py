@@ -0,0 +1,195 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from src.utils.constants import *
+from src.core.batch import BatchGame, DEATH_CAUSES
+from src.core.tuning import Tuning
+
+# One row per episode, written in place by the worker that ran it
+EPISODE_DTYPE = np.dtype([
+    ('score', np.int32),
+    ('frames', np.int32),  # Steps survived
+    ('death_cause', np.int8),  # Index into DEATH_CAUSES; 0 if cut off at max_frames
+    ('death_distance', np.float32),  # How far the course had scrolled
+    ('death_y', np.float32),  # Bird y at the end
+])
+
+# Episodes per task; fixed so results do not depend on the number of workers
+CHUNK_EPISODES = 4096
+
+NAN = float("nan")
+
+
+class RandomPolicy:
+    """Flap with a fixed probability every step."""
+
+    def __init__(self, flap_probability=0.07):
+        self.flap_probability = flap_probability
+
+    def start(self, games, rows, rng):
+        pass
+
+    def act(self, games, rng):
+        return rng.random(games.n) < self.flap_probability
+
+
+class AutopilotPolicy:
+    """
+    Flap whenever the bird sinks below its aim point in the next gap. Each
+    episode aims at a random offset from the gap center and has occasional
+    lapses of attention, so it plays like a decent but fallible player.
+    """
+
+    def __init__(self, aim_spread=(-10, 50), lapse_rate=0.003, lapse_steps=30):
+        self.aim_spread = aim_spread
+        self.lapse_rate = lapse_rate
+        self.lapse_steps = lapse_steps
+        self.aim = None
+        self.lapse = None
+
+    def start(self, games, rows, rng):
+        if self.aim is None or len(self.aim) != games.n:
+            self.aim = np.zeros(games.n)
+            self.lapse = np.zeros(games.n, dtype=np.int64)
+        self.aim[rows] = rng.uniform(*self.aim_spread, len(rows))
+        self.lapse[rows] = 0
+
+    def act(self, games, rng):
+        has_next, _, next_gap_y = games.next_obstacles()
+        gap_y = np.where(has_next, next_gap_y, HEIGHT // 2)
+
+        self.lapse = np.where(rng.random(games.n) < self.lapse_rate, self.lapse_steps,
+                              np.maximum(self.lapse - 1, 0))
+        return (games.y + BIRD_SIZE / 2 > gap_y + self.aim) & (games.velocity > 0) & (self.lapse == 0)
+
+
+POLICIES = {'autopilot': AutopilotPolicy, 'random': RandomPolicy}
+
+
+def _attach(name):
+    # Workers only borrow the block; the parent owns and unlinks it, and the
+    # resource tracker the pool shares with it already knows about it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def _run_chunk(shm_name, total, start, stop, chunk_seed, tuning, policy, lanes, max_frames, dt):
+    shm = _attach(shm_name)
+    try:
+        results = np.ndarray((total,), dtype=EPISODE_DTYPE, buffer=shm.buf)
+        run_episodes(results[start:stop], chunk_seed, tuning, policy, lanes, max_frames, dt)
+        del results
+    finally:
+        shm.close()
+    return stop - start
+
+
+def run_episodes(out, seed, tuning=None, policy=None, lanes=1024, max_frames=36000, dt=1 / 60):
+    """
+    Play len(out) episodes in one BatchGame, starting a new episode in a
+    lane as soon as the last one ends, and write a row of out per episode.
+    """
+    count = len(out)
+    if not count:
+        return
+    rng = np.random.default_rng(seed)
+    policy = policy if policy is not None else AutopilotPolicy()
+    n = min(lanes, count)
+    games = BatchGame(n, seed=rng.integers(2 ** 63), tuning=tuning)
+    tuning = games.tuning
+
+    episode = np.arange(n)  # Episode each lane is playing, -1 once it is idle
+    next_episode = n
+    distance = np.zeros(n)
+    policy.start(games, np.arange(n), rng)
+
+    while True:
+        live = episode >= 0
+        if not live.any():
+            break
+        actions = policy.act(games, rng) & live
+
+        # Distance covered this step, at the speed the step starts with
+        speed = tuning.base_obstacle_speed * games.speed_multipliers(games.score) * dt
+        distance += np.where(games.alive, speed, 0)
+        games.step(actions, dt)
+
+        finished = np.flatnonzero(live & (~games.alive | (games.frames >= max_frames)))
+        if not len(finished):
+            continue
+        rows = episode[finished]
+        out['score'][rows] = games.score[finished]
+        out['frames'][rows] = games.frames[finished]
+        out['death_cause'][rows] = np.where(games.alive[finished], 0, games.death_cause[finished])
+        out['death_distance'][rows] = distance[finished]
+        out['death_y'][rows] = games.y[finished]
+
+        # Restart the finished lanes on the next episodes, or idle them
+        restart = finished[:max(0, min(len(finished), count - next_episode))]
+        idle = finished[len(restart):]
+        episode[restart] = np.arange(next_episode, next_episode + len(restart))
+        next_episode += len(restart)
+        episode[idle] = -1
+        games.alive[idle] = False
+        if len(restart):
+            mask = np.zeros(n, dtype=bool)
+            mask[restart] = True
+            games.reset(mask)
+            distance[restart] = 0
+            policy.start(games, restart, rng)
+
+
+def run_rollouts(episodes, tuning=None, policy=None, workers=None, seed=0, lanes=1024,
+                 max_frames=36000, dt=1 / 60):
+    """
+    Play episodes headless games across a process pool and return their
+    results as an EPISODE_DTYPE array. Workers write straight into one
+    shared memory block, so nothing but the chunk bounds is pickled.
+    Results depend only on seed, not on the number of workers.
+    """
+    tuning = tuning if tuning is not None else Tuning()
+    policy = policy if policy is not None else AutopilotPolicy()
+    workers = workers or os.cpu_count()
+
+    chunks = [(start, min(start + CHUNK_EPISODES, episodes)) for start in range(0, episodes, CHUNK_EPISODES)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, episodes * EPISODE_DTYPE.itemsize))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_chunk, shm.name, episodes, start, stop, chunk_seed,
+                            tuning, policy, lanes, max_frames, dt)
+                for (start, stop), chunk_seed in zip(chunks, seeds)
+            ]
+            for future in futures:
+                future.result()
+        results = np.ndarray((episodes,), dtype=EPISODE_DTYPE, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
+
+
+def summarize(results):
+    """Headline numbers for a set of episode results; NaN scores if it is empty."""
+    scores = results['score']
+    if not len(results):
+        summary = dict(episodes=0, mean_score=NAN, median_score=NAN, p90_score=NAN, max_score=0, mean_frames=NAN)
+        summary.update((f"{cause or 'survived'}_share", 0.0) for cause in DEATH_CAUSES)
+        return summary
+    summary = {
+        'episodes': len(results),
+        'mean_score': float(scores.mean()),
+        'median_score': float(np.median(scores)),
+        'p90_score': float(np.percentile(scores, 90)),
+        'max_score': int(scores.max()),
+        'mean_frames': float(results['frames'].mean()),
+    }
+    causes = np.bincount(results['death_cause'], minlength=len(DEATH_CAUSES))
+    for code, cause in enumerate(DEATH_CAUSES):
+        summary[f"{cause or 'survived'}_share"] = float(causes[code] / len(results))
+    return summary
@@ -0,0 +1,124 @@
+import os
+import mmap
+import struct
+import numpy as np
+from src.utils.constants import *
+from src.core.batch import DEATH_CAUSES
+
+# File layout: a fixed header, then one fixed-width record per physics step
+TELEMETRY_MAGIC = b"FBTL"
+TELEMETRY_VERSION = 1
+HEADER = struct.Struct("<4sBHQ")  # magic, version, record size, record count
+HEADER_SIZE = 64  # Space reserved for the header, so it can grow without moving the records
+COUNT = struct.Struct("<Q")  # The record count alone, rewritten after every record
+COUNT_OFFSET = HEADER.size - COUNT.size
+TELEMETRY_EXTENSION = ".fbtl"
+
+# One physics step of a round. Records are packed little-endian, so RECORD
+# writes exactly what TELEMETRY_DTYPE reads
+TELEMETRY_DTYPE = np.dtype([
+    ('round_seed', '<u8'),  # Which round the step belongs to
+    ('frame', '<u4'),  # Physics steps into the round, after this one
+    ('dt', '<f4'),
+    ('bird_x', '<f4'),
+    ('bird_y', '<f4'),
+    ('velocity', '<f4'),
+    ('angle', '<f4'),
+    ('score', '<u4'),
+    ('speed_multiplier', '<f4'),
+    ('obstacle_x', '<f4'),  # The first pipe the bird has not cleared; NaN before one spawns
+    ('gap_y', '<f4'),
+    ('death_cause', 'u1'),  # Index into src.core.batch.DEATH_CAUSES; 0 while alive
+])
+RECORD = struct.Struct("<QIfffffIfffB")
+
+# Records the file grows by at a time
+CHUNK_RECORDS = 1 << 16
+
+DEATH_CODES = {cause: code for code, cause in enumerate(DEATH_CAUSES)}
+NAN = float("nan")
+
+
+class TelemetryError(ValueError):
+    """Raised for a file that is not a telemetry log."""
+
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise TelemetryError(f"{path} is not a telemetry log")
+    magic, version, record_size, count = HEADER.unpack_from(data)
+    if magic != TELEMETRY_MAGIC:
+        raise TelemetryError(f"{path} is not a telemetry log")
+    if version != TELEMETRY_VERSION or record_size != RECORD.size:
+        raise TelemetryError(f"{path} is a version {version} telemetry log; expected version {TELEMETRY_VERSION}")
+    return count
+
+
+class TelemetryRecorder:
+    """
+    Appends one binary record per physics step to a memory-mapped file.
+
+    A record is a fixed-width struct written straight into the mapping, and
+    the record count in the header is updated after it, so a reader (or a
+    crash) only ever sees whole records. The file grows by CHUNK_RECORDS at
+    a time and is trimmed to its records on close(). An existing log is
+    appended to, so many sessions can share one file, one at a time.
+    """
+
+    def __init__(self, path, chunk_records=CHUNK_RECORDS):
+        self.path = path
+        self.chunk_records = chunk_records
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self.count = _check_header(self._file.read(HEADER.size), path)
+        else:
+            self.count = 0
+        self._map(self.count + chunk_records)
+        if not exists:
+            HEADER.pack_into(self._mmap, 0, TELEMETRY_MAGIC, TELEMETRY_VERSION, RECORD.size, 0)
+
+    def _map(self, capacity):
+        self.capacity = capacity
+        self._file.truncate(HEADER_SIZE + capacity * RECORD.size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+    def _grow(self):
+        self._mmap.close()
+        self._map(self.capacity + self.chunk_records)
+
+    def record(self, game, dt, round_seed=0):
+        """Append the state of game after a physics step of dt seconds."""
+        if self.count == self.capacity:
+            self._grow()
+        bird = game.bird
+        obs = game.next_obstacle()
+        obstacle_x, gap_y = (obs.x, obs.gap_y) if obs is not None else (NAN, NAN)
+        RECORD.pack_into(
+            self._mmap, HEADER_SIZE + self.count * RECORD.size,
+            round_seed, game.frame, dt, bird.x, bird.y, bird.velocity, bird.angle, game.score,
+            get_speed_multiplier(game.score), obstacle_x, gap_y, DEATH_CODES[game.death_cause]
+        )
+        self.count += 1
+        COUNT.pack_into(self._mmap, COUNT_OFFSET, self.count)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(HEADER_SIZE + self.count * RECORD.size)
+        self._file.close()
+
+
+def read_telemetry(path):
+    """
+    A telemetry log as a read-only TELEMETRY_DTYPE array mapped from the
+    file, without parsing or copying. Records appended later are not
+    included; read again to see them.
+    """
+    with open(path, "rb") as f:
+        count = _check_header(f.read(HEADER.size), path)
+    if not count:
+        return np.zeros(0, dtype=TELEMETRY_DTYPE)
+    return np.memmap(path, dtype=TELEMETRY_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
@@ -0,0 +1,37 @@
+class FixedTimestep:
+    """
+    Turns variable frame times into a whole number of fixed physics steps.
+
+    Frame time is added to an accumulator and drained in steps of exactly
+    dt, so the simulation is the same at any frame rate. What is left over
+    is the fraction of a step the display is ahead of the physics, used to
+    interpolate drawing between the last two states. A slow frame runs
+    several steps before the next draw; only stalls longer than
+    max_frame_time (window drags, breakpoints) are dropped, which slows the
+    game down rather than letting it fall ever further behind.
+    """
+
+    def __init__(self, hz=60, max_frame_time=0.25):
+        if hz <= 0:
+            raise ValueError(f"Physics rate must be positive, got {hz}")
+        self.hz = hz
+        self.dt = 1 / hz
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Add a frame's worth of time and return the number of steps to run."""
+        self.accumulator += min(frame_time, self.max_frame_time)
+        steps = 0
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            steps += 1
+        return steps
+
+    @property
+    def alpha(self):
+        # How far between the previous and the current state to draw, 0 to 1
+        return self.accumulator / self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,48 @@
+from src.utils.constants import *
+from src.core.obstacles import obstacle_capacity
+
+# Balance constants a Tuning can override, with the names used in src.utils.constants
+TUNABLES = ('GRAVITY', 'FLAP_STRENGTH', 'MAX_FALL_SPEED', 'BASE_OBSTACLE_SPEED', 'MAX_OBSTACLE_SPEED',
+            'SPEED_INCREASE_FACTOR', 'GAP_HEIGHT', 'SPACING')
+
+
+class Tuning:
+    """
+    One set of balance constants for BatchGame. Defaults come from
+    src.utils.constants; keyword arguments named like the constants override
+    them, e.g. Tuning(GRAVITY=650, GAP_HEIGHT=180). Plain values only, so a
+    Tuning can be sent to worker processes.
+    """
+
+    def __init__(self, **overrides):
+        unknown = set(overrides) - set(TUNABLES)
+        if unknown:
+            raise ValueError(f"Unknown tunable(s): {', '.join(sorted(unknown))}")
+        values = {name: globals()[name] for name in TUNABLES}
+        values.update(overrides)
+        self.overrides = overrides
+
+        self.gravity = values['GRAVITY']
+        self.flap_strength = values['FLAP_STRENGTH']
+        self.max_fall_speed = values['MAX_FALL_SPEED']
+        self.base_obstacle_speed = values['BASE_OBSTACLE_SPEED']
+        self.max_obstacle_speed = values['MAX_OBSTACLE_SPEED']
+        self.speed_increase_factor = values['SPEED_INCREASE_FACTOR']
+        self.gap_height = values['GAP_HEIGHT']
+        self.spacing = values['SPACING']
+
+        # Range of gap centers, as in GameState.spawn_obstacle
+        self.gap_y_min = self.gap_height // 2 + 50
+        self.gap_y_max = HEIGHT - GROUND_HEIGHT - self.gap_height // 2 - 50
+        if self.gap_y_min > self.gap_y_max:
+            raise ValueError(f"GAP_HEIGHT {self.gap_height} leaves no room for the gap")
+
+        self.max_obstacles = obstacle_capacity(self.spacing)
+
+    def __repr__(self):
+        settings = ", ".join(f"{name}={value}" for name, value in self.overrides.items())
+        return f"Tuning({settings})"
+
+    def speed_multiplier(self, score):
+        # get_speed_multiplier with these constants
+        return min(1 + score * self.speed_increase_factor, self.max_obstacle_speed / self.base_obstacle_speed)
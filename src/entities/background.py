@@ -1,54 +1,55 @@
+import copy
 import pygame
 import random
+import numpy as np
 from src.utils.constants import *
-from src.entities.cloud import Cloud
+from src.entities.cloud import Cloud, CloudLayer
+
+
+def fill_rows(surface, colors):
+    """
+    Fill row y of surface with colors[y] in one bulk write. Float colors
+    are truncated, as pygame.draw does.
+    """
+    red, green, blue = np.asarray(colors).astype(np.uint8).astype(np.uint32).T
+    red_shift, green_shift, blue_shift, _ = surface.get_shifts()
+    red_loss, green_loss, blue_loss, _ = surface.get_losses()
+    # Pack each row's color into the surface's pixel format
+    mapped = (((red >> red_loss) << red_shift) | ((green >> green_loss) << green_shift) |
+              ((blue >> blue_loss) << blue_shift))
+    pygame.surfarray.pixels2d(surface)[...] = mapped[None, :]
+
 
 class Background:
-    def __init__(self):
+    def __init__(self, rng=None):
+        rng = rng if rng is not None else random
         # Base speeds for each layer
         self.base_speeds = [30, 60, 90]
+        # Cloud layers: (minimum y, maximum y, scale) for each
+        layer_specs = [
+            (50, HEIGHT//3, 1.2),
+            (30, HEIGHT//3, 1.0),
+            (20, HEIGHT//4, 0.8)
+        ]
         self.layers = [
-            {
-                'speed': self.base_speeds[0],
-                'position': 0,
-                'clouds': [
-                    Cloud(
-                        random.randint(0, WIDTH),
-                        random.randint(50, HEIGHT//3),
-                        self.base_speeds[0],
-                        scale=1.2
-                    ) for _ in range(NUM_CLOUDS_PER_LAYER)
-                ]
-            },
-            {
-                'speed': self.base_speeds[1],
-                'position': 0,
-                'clouds': [
+            CloudLayer(
+                [
                     Cloud(
-                        random.randint(0, WIDTH),
-                        random.randint(30, HEIGHT//3),
-                        self.base_speeds[1],
-                        scale=1.0
+                        rng.randint(0, WIDTH),
+                        rng.randint(min_y, max_y),
+                        speed,
+                        scale=scale,
+                        rng=rng
                     ) for _ in range(NUM_CLOUDS_PER_LAYER)
-                ]
-            },
-            {
-                'speed': self.base_speeds[2],
-                'position': 0,
-                'clouds': [
-                    Cloud(
-                        random.randint(0, WIDTH),
-                        random.randint(20, HEIGHT//4),
-                        self.base_speeds[2],
-                        scale=0.8
-                    ) for _ in range(NUM_CLOUDS_PER_LAYER)
-                ]
-            }
+                ],
+                speed
+            ) for speed, (min_y, max_y, scale) in zip(self.base_speeds, layer_specs)
         ]
         
         # Create ground surface with double width for seamless scrolling
         self.ground_width = WIDTH * 2
         self.ground_position = 0
+        self.ground_step = 0  # Distance scrolled by the last update, for interpolation
         self.ground_speed = BASE_OBSTACLE_SPEED  # Match obstacle speed
         self.ground_surface = pygame.Surface((self.ground_width, GROUND_HEIGHT))
         
@@ -62,35 +63,21 @@ class Background:
         # Create layered ground effect
         grass_height = int(GROUND_HEIGHT * 0.4)  # Top 40% is grass
         
-        # Fill the base with dark dirt
-        self.ground_surface.fill(dirt_bottom)
-        
-        # Add dirt gradient
-        for y in range(grass_height, GROUND_HEIGHT):
-            progress = (y - grass_height) / (GROUND_HEIGHT - grass_height)
-            color = (
-                dirt_top[0] + (dirt_bottom[0] - dirt_top[0]) * progress,
-                dirt_top[1] + (dirt_bottom[1] - dirt_top[1]) * progress,
-                dirt_top[2] + (dirt_bottom[2] - dirt_top[2]) * progress
-            )
-            pygame.draw.line(self.ground_surface, color, (0, y), (self.ground_width, y))
-        
-        # Add grass layers
-        for y in range(grass_height):
-            progress = y / grass_height
-            if progress < 0.3:  # Top layer
-                color = grass_top
-            elif progress < 0.6:  # Middle layer
-                color = grass_mid
-            else:  # Bottom layer
-                color = grass_bottom
-            pygame.draw.line(self.ground_surface, color, (0, y), (self.ground_width, y))
+        # Grass bands on top, then a dirt gradient, one color per row
+        rows = np.arange(GROUND_HEIGHT)
+        progress = (rows - grass_height) / (GROUND_HEIGHT - grass_height)
+        colors = np.array(dirt_top) + (np.array(dirt_bottom) - np.array(dirt_top)) * progress[:, None]
+        grass_progress = rows[:grass_height] / grass_height
+        colors[:grass_height] = np.where(
+            (grass_progress < 0.3)[:, None], grass_top,
+            np.where((grass_progress < 0.6)[:, None], grass_mid, grass_bottom))
+        fill_rows(self.ground_surface, colors)
         
         # Add grass tufts
         for _ in range(100):
-            x = random.randint(0, self.ground_width)
-            height = random.randint(4, 8)
-            width = random.randint(3, 6)
+            x = rng.randint(0, self.ground_width)
+            height = rng.randint(4, 8)
+            width = rng.randint(3, 6)
             pygame.draw.ellipse(self.ground_surface, grass_top, 
                               (x, 0, width, height))
         
@@ -102,55 +89,61 @@ class Background:
         ]
         
         for _ in range(40):
-            x = random.randint(0, self.ground_width)
-            y = random.randint(2, grass_height - 4)
-            color = random.choice(flower_colors)
-            size = random.randint(2, 3)
+            x = rng.randint(0, self.ground_width)
+            y = rng.randint(2, grass_height - 4)
+            color = rng.choice(flower_colors)
+            size = rng.randint(2, 3)
             pygame.draw.circle(self.ground_surface, color, (x, y), size)
         
         # Create a gradient sky
         self.sky = pygame.Surface((WIDTH, HEIGHT))
-        for y in range(HEIGHT):
-            color = (
-                135 - (y / HEIGHT) * 30,
-                206 - (y / HEIGHT) * 40,
-                235 - (y / HEIGHT) * 30
-            )
-            pygame.draw.line(self.sky, color, (0, y), (WIDTH, y))
+        fraction = np.arange(HEIGHT)[:, None] / HEIGHT
+        fill_rows(self.sky, np.array([135, 206, 235]) - fraction * np.array([30, 40, 30]))
 
     def update(self, dt, score=0):
         speed_multiplier = get_speed_multiplier(score)
         
-        # Update cloud layers with scaled speed
+        # Scroll cloud layers with scaled speed
         for i, layer in enumerate(self.layers):
-            scaled_speed = self.base_speeds[i] * speed_multiplier
-            layer['position'] = (layer['position'] - scaled_speed * dt) % WIDTH
-            # Update clouds in this layer with scaled speed
-            for cloud in layer['clouds']:
-                cloud.speed = scaled_speed
-                cloud.update(dt)
+            layer.update(dt, self.base_speeds[i] * speed_multiplier)
         
         # Update ground position with scaled speed
-        scaled_ground_speed = self.ground_speed * speed_multiplier
-        self.ground_position = (self.ground_position - scaled_ground_speed * dt) % WIDTH
+        self.ground_step = self.ground_speed * speed_multiplier * dt
+        self.ground_position = (self.ground_position - self.ground_step) % WIDTH
+
+    def snapshot(self):
+        """A copy of the scroll positions that later updates leave alone; the artwork is shared."""
+        view = copy.copy(self)
+        view.layers = [layer.snapshot() for layer in self.layers]
+        return view
+
+    def draw(self, screen, show_hitboxes=False, draw_sky=True, alpha=1.0):
+        """
+        Draw the background and return the rects that were touched.
+        With draw_sky=False the caller is responsible for the sky, e.g. by
+        restoring only the regions that changed. alpha places the scrolling
+        layers between their last two updates.
+        """
+        dirty = []
 
-    def draw(self, screen, show_hitboxes=False):
         # Draw the gradient sky background
-        screen.blit(self.sky, (0, 0))
+        if draw_sky:
+            dirty.append(screen.blit(self.sky, (0, 0)))
         
-        # Draw the clouds for each layer
+        # Draw the pre-composited cloud layers
         for layer in self.layers:
-            for cloud in layer['clouds']:
-                cloud.draw(screen)
+            dirty.extend(layer.draw(screen, alpha))
         
         # Draw scrolling ground
         ground_y = HEIGHT - GROUND_HEIGHT
-        screen.blit(self.ground_surface, (self.ground_position, ground_y))
-        screen.blit(self.ground_surface, (self.ground_position - self.ground_width/2, ground_y))
+        ground_position = (self.ground_position + self.ground_step * (1 - alpha)) % WIDTH
+        dirty.append(screen.blit(self.ground_surface, (ground_position, ground_y)))
+        dirty.append(screen.blit(self.ground_surface, (ground_position - self.ground_width/2, ground_y)))
         
         # Draw ground hitbox if enabled
         if show_hitboxes:
             ground_rect = pygame.Rect(0, HEIGHT - GROUND_HEIGHT + 2, WIDTH, GROUND_HEIGHT - 2)
-            pygame.draw.rect(screen, (255, 0, 0), ground_rect, 1)
-            pygame.draw.line(screen, (255, 0, 0), (0, HEIGHT - GROUND_HEIGHT),
-                           (WIDTH, HEIGHT - GROUND_HEIGHT), 2) 
\ No newline at end of file
+            dirty.append(pygame.draw.rect(screen, (255, 0, 0), ground_rect, 1))
+            dirty.append(pygame.draw.line(screen, (255, 0, 0), (0, HEIGHT - GROUND_HEIGHT),
+                                          (WIDTH, HEIGHT - GROUND_HEIGHT), 2))
+        return dirty 
\ No newline at end of file
@@ -1,27 +1,83 @@
+import copy
+import math
 import random
+import pygame
 from src.utils.constants import *
 from src.utils.helpers import load_scaled_image
 
+# Clouds leave the screen at this x and come back in at WIDTH + CLOUD_RESPAWN_MARGIN
+CLOUD_EXIT_X = -200  # Use a larger value to account for cloud width
+CLOUD_RESPAWN_MARGIN = 100
+CLOUD_PERIOD = WIDTH + CLOUD_RESPAWN_MARGIN - CLOUD_EXIT_X
+
 class Cloud:
-    def __init__(self, x, y, speed, scale=1.0):
+    def __init__(self, x, y, speed, scale=1.0, rng=None):
+        rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.speed = speed
-        self.scale = scale * random.uniform(CLOUD_MIN_SCALE, CLOUD_MAX_SCALE)
-        
+        self.scale = scale * rng.uniform(CLOUD_MIN_SCALE, CLOUD_MAX_SCALE)
+
         # Load one of three cloud variations randomly
-        cloud_num = random.randint(1, 3)
-        self.image = load_scaled_image(f'cloud{cloud_num}.PNG', (int(100 * self.scale), int(60 * self.scale)))
-        
-        # Add some transparency to the cloud
-        if self.image:
-            self.image.set_alpha(220)
-
-    def update(self, dt):
-        self.x -= self.speed * dt
-        if self.x + 200 < 0:  # Use a larger value to account for cloud width
-            self.x = WIDTH + 100
-
-    def draw(self, screen):
-        if self.image:
-            screen.blit(self.image, (self.x, self.y)) 
\ No newline at end of file
+        cloud_num = rng.randint(1, 3)
+        # Add some transparency to the cloud; the image is shared, so the
+        # alpha is part of the cached variant rather than set afterwards
+        self.image = load_scaled_image(f'cloud{cloud_num}.PNG', (int(100 * self.scale), int(60 * self.scale)), alpha=220)
+
+
+class CloudLayer:
+    """
+    One parallax layer of clouds, pre-composited into a wrap-around strip.
+
+    All clouds in a layer move at the same speed and wrap with the same
+    period, so the layer is a fixed pattern that only scrolls. The strip
+    holds one period of it and is drawn with at most two blits, whatever
+    the number of clouds. It is rebuilt only when the clouds change.
+    """
+
+    def __init__(self, clouds, speed):
+        self.clouds = clouds
+        self.speed = speed
+        self.position = 0
+        self.step = 0  # Distance scrolled by the last update, for interpolation
+        self.strip = None
+        self.build_strip()
+
+    def build_strip(self):
+        self.top = min(cloud.y for cloud in self.clouds)
+        height = max(cloud.y + cloud.image.get_height() for cloud in self.clouds) - self.top
+        self.strip = pygame.Surface((CLOUD_PERIOD, height), pygame.SRCALPHA)
+        self.strip.fill((0, 0, 0, 0))
+        for cloud in self.clouds:
+            u = (cloud.x - CLOUD_EXIT_X) % CLOUD_PERIOD
+            y = cloud.y - self.top
+            self.strip.blit(cloud.image, (u, y))
+            if u + cloud.image.get_width() > CLOUD_PERIOD:
+                # Wrap the part past the end of the strip around to its start
+                self.strip.blit(cloud.image, (u - CLOUD_PERIOD, y))
+        if pygame.display.get_surface() is not None:
+            self.strip = self.strip.convert_alpha()
+        # Most of the strip is transparent sky; run-length encoding lets
+        # blits skip those runs instead of blending them
+        self.strip.set_alpha(255, pygame.RLEACCEL)
+
+    def update(self, dt, speed):
+        self.speed = speed
+        self.step = speed * dt
+        self.position = (self.position - self.step) % CLOUD_PERIOD
+
+    def snapshot(self):
+        # Only the scroll position changes; the strip is shared
+        return copy.copy(self)
+
+    def draw(self, screen, alpha=1.0):
+        # Back up from the current position to alpha of the way through the last update
+        position = self.position + self.step * (1 - alpha)
+        # Strip column shown at the left edge of the screen
+        start = math.ceil((-CLOUD_EXIT_X - position) % CLOUD_PERIOD) % CLOUD_PERIOD
+        first = min(WIDTH, CLOUD_PERIOD - start)
+        height = self.strip.get_height()
+        dirty = [screen.blit(self.strip, (0, self.top), (start, 0, first, height))]
+        if first < WIDTH:
+            dirty.append(screen.blit(self.strip, (first, self.top), (0, 0, WIDTH - first, height)))
+        return dirty
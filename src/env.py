@@ -0,0 +1,168 @@
+import os
+import numpy as np
+from functools import partial
+from src.utils.constants import *
+from src.core.game import GameState, PLAYING
+from src.core.rng import RngStreams
+
+FEATURES = "features"
+PIXELS = "pixels"
+OBSERVATIONS = (FEATURES, PIXELS)
+
+# Layout of the feature vector
+FEATURE_NAMES = ("bird_y", "velocity", "angle", "next_dx", "next_gap_y", "speed_multiplier")
+
+
+class FlappyEnv:
+    """
+    Gym-style environment over the game loop of src.main: reset() starts a
+    round, step(action) applies one input (truthy to flap) and advances one
+    physics step, returning (observation, reward, terminated, truncated, info).
+    The reward is the number of pipes passed during the step.
+
+    Observations are views, not copies, and are overwritten by the next
+    step; copy them to keep them.
+    - "features": a preallocated float32 vector laid out as FEATURE_NAMES.
+      Runs on the headless core, without pygame.
+    - "pixels": game_surface as a (WIDTH, HEIGHT, 3) uint8 RGB array, laid
+      out like pygame.surfarray.pixels3d. game_surface is drawn straight
+      into a preallocated buffer and the array is a view of it, so unlike a
+      pixels3d array it never locks the surface between steps.
+    """
+
+    def __init__(self, observation=FEATURES, seed=None, physics_hz=60, max_steps=None, show_hitboxes=False):
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"Unknown observation mode {observation!r}; expected one of {OBSERVATIONS}")
+        self.observation = observation
+        self.dt = 1 / physics_hz
+        self.hz = physics_hz
+        self.max_steps = max_steps
+        self.show_hitboxes = show_hitboxes
+        self.streams = RngStreams(seed)
+        self.round_seed = None
+        self.features = np.zeros(len(FEATURE_NAMES), dtype=np.float32)
+
+        if observation == PIXELS:
+            self._init_render()
+            self.observation_shape = (WIDTH, HEIGHT, 3)
+        else:
+            self.observation_shape = self.features.shape
+        self._use_streams(self.streams)
+
+    def _use_streams(self, streams):
+        # Pipes, particles and scenery each draw from their own stream, as in
+        # the game; obstacles and scenery take theirs when they are built.
+        # Obstacles emit into this env's own particle pool
+        self.streams = streams
+        if self.observation == PIXELS:
+            self.game = GameState(
+                rng=streams.gameplay,
+                bird_factory=partial(self._bird_class, show_hitboxes=self.show_hitboxes),
+                obstacle_factory=partial(self._obstacle_class, show_hitboxes=self.show_hitboxes,
+                                         rng=streams.effects, particles=self.particles)
+            )
+            self.background = self._background_class(rng=streams.scenery)
+        else:
+            self.game = GameState(rng=streams.gameplay)
+
+    def _init_render(self):
+        # The render views, particles and HUD of src.main, drawing offscreen
+        from src.utils.startup import import_pygame
+        pygame = import_pygame()
+        from src.main import update_world, draw_world
+        from src.entities.bird import Bird
+        from src.entities.obstacle import Obstacle
+        from src.entities.background import Background
+        from src.render.particles import ParticleSystem
+        from src.render.hud import Hud
+
+        if not pygame.display.get_init() or pygame.display.get_surface() is None:
+            # Sprites are converted to the display format, so some display is
+            # needed; without a window, use SDL's offscreen driver
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.display.init()
+            pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.font.init()
+        self._update_world = update_world
+        self._draw_world = draw_world
+
+        self._bird_class = Bird
+        self._obstacle_class = Obstacle
+        self._background_class = Background
+        # Its own pool, not the process-wide one, so other envs and the game
+        # in the same process never show up in its observations
+        self.particles = ParticleSystem()
+        self.hud = Hud(pygame.font.Font(None, 55))
+
+        # game_surface draws into this buffer; its byte order matches the
+        # display format so sprite blits stay on SDL's fast path. A pixels3d
+        # array would lock the surface, and a locked surface cannot be
+        # blitted to while the caller still holds the last observation
+        self._buffer = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+        self.game_surface = pygame.image.frombuffer(self._buffer, (WIDTH, HEIGHT), "BGRA")
+        self.game_surface.set_alpha(None)  # Opaque, like a plain Surface
+        self.pixels = self._buffer.transpose(1, 0, 2)[:, :, 2::-1]
+
+    def reset(self, seed=None):
+        """
+        Start a new round and return (observation, info). A seed restarts
+        the session streams, so the rounds that follow repeat exactly.
+        """
+        if seed is not None:
+            self._use_streams(RngStreams(seed))
+        # Each round has its own seed, as in the game, so it can be saved as a replay
+        self.round_seed = self.streams.new_round()
+        self.game.start()
+        if self.observation == PIXELS:
+            self.particles.clear()
+        return self._observe(), {"round_seed": self.round_seed, "score": 0, "frame": 0}
+
+    def step(self, action):
+        game = self.game
+        score = game.score
+        if action and game.game_state == PLAYING:
+            game.bird.flap()
+        if self.observation == PIXELS:
+            self._update_world(game, self.background, self.particles, self.dt)
+        else:
+            game.update(self.dt)
+
+        terminated = game.game_state != PLAYING
+        truncated = not terminated and self.max_steps is not None and game.frame >= self.max_steps
+        info = {"score": game.score, "frame": game.frame}
+        if terminated:
+            info["death_cause"] = game.death_cause
+        return self._observe(), game.score - score, terminated, truncated, info
+
+    def _observe(self):
+        if self.observation == PIXELS:
+            return self.render()
+        return self._write_features()
+
+    def _write_features(self):
+        game = self.game
+        bird = game.bird
+        # Until the first pipe spawns, the next one appears at the right edge
+        obs = game.next_obstacle()
+        if obs is not None:
+            next_dx = obs.x - bird.x
+            next_gap_y = obs.gap_y
+        else:
+            next_dx = WIDTH - bird.x
+            next_gap_y = HEIGHT // 2
+        self.features[:] = (bird.y, bird.velocity, bird.angle, next_dx, next_gap_y,
+                            get_speed_multiplier(game.score))
+        return self.features
+
+    def render(self):
+        """Draw the current state to game_surface and return the pixel view."""
+        if self.observation != PIXELS:
+            raise RuntimeError("render() needs observation='pixels'")
+        self.game_surface.fill((0, 0, 0))
+        self._draw_world(self.game_surface, self.game, self.background, self.particles, self.hud,
+                         show_hitboxes=self.show_hitboxes)
+        return self.pixels
+
+    def close(self):
+        if self.observation == PIXELS:
+            self.particles.clear()
@@ -1,20 +1,147 @@
-import pygame
 import sys
-import random
+import time
+from src.utils.startup import import_pygame, process_age
+
+# Taken before pygame and the game modules load, for --startup-benchmark
+IMPORT_START = time.perf_counter()
+
+import_pygame()
+import pygame
+import os
+import atexit
 import argparse
+from functools import partial
 from src.utils.constants import *
+from src.core.game import GameState, START, PLAYING, GAME_OVER
+from src.core.timestep import FixedTimestep
+from src.core.pacing import FramePacer
+from src.core.rng import RngStreams
+from src.core.replay import ReplayRecorder, REPLAY_EXTENSION
+from src.core.profiler import FrameProfiler
+from src.core.pipeline import SimulationThread
+from src.core.telemetry import TelemetryRecorder
 from src.entities.bird import Bird
 from src.entities.obstacle import Obstacle
 from src.entities.background import Background
+from src.render.particles import get_particle_system
+from src.render.hud import Hud, ProfilerOverlay
+from src.render.pipes import get_pipe_textures
+from src.render.dirty import DirtyRectRenderer
+from src.render.output import OutputStage, SCALE_MODES
+
+def update_world(game, background, particles, dt, profiler=None):
+    """Advance the scenery, particles and game rules by one physics step."""
+    # Update background with current score
+    background.update(dt, game.score)
+    if profiler is not None:
+        profiler.lap("background_update")
+
+    # Age existing particles; obstacles emit new ones as they update
+    if game.game_state == PLAYING:
+        particles.update(dt)
+    if profiler is not None:
+        profiler.lap("particles_update")
+
+    # Advance the game rules
+    game.update(dt)
+
+
+def draw_world(surface, game, background, particles, hud, show_hitboxes=False, draw_sky=True, alpha=1.0,
+               profiler=None):
+    """Draw one frame of the game onto surface and return the rects that were drawn."""
+    drawn = background.draw(surface, show_hitboxes=show_hitboxes, draw_sky=draw_sky, alpha=alpha)
+    if profiler is not None:
+        profiler.lap("background_draw")
+
+    if game.game_state == PLAYING:
+        for obs in game.obstacles:
+            drawn += obs.draw(surface, alpha)
+        drawn += particles.draw(surface)
+        drawn += game.bird.draw(surface, alpha)
+        if profiler is not None:
+            profiler.lap("entity_draw")
+
+        # Draw score and speed from cached labels
+        drawn += hud.draw_playing(surface, game.score)
+
+    elif game.game_state == START:
+        drawn += hud.draw_start(surface)
+
+    elif game.game_state == GAME_OVER:
+        drawn += hud.draw_game_over(surface, game.score)
+
+    if profiler is not None:
+        profiler.lap("hud")
+    return drawn
+
+
+def deferred_work(game, hud):
+    """
+    Build what the start screen does not show but the first round needs,
+    one piece per next() so it can run a little every frame once the start
+    screen is up.
+    """
+    get_pipe_textures()
+    yield
+    hud.prepare_playing()
+    yield
+    yield from game.bird.warm_sprites()
+
 
 def main():
+    main_start = time.perf_counter()
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Flappy Bird Style Game')
     parser.add_argument('--show-hitboxes', action='store_true', help='Show collision hitboxes')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='Only redraw and present the parts of the screen that changed')
+    parser.add_argument('--scale-mode', choices=SCALE_MODES, default='smooth',
+                        help='How the game is scaled to the window size')
+    parser.add_argument('--physics-hz', type=int, default=60,
+                        help='Fixed physics update rate, independent of the frame rate')
+    parser.add_argument('--fps', type=int, choices=(30, 60, 120, 0), default=60,
+                        help='Target frame rate; 0 runs unlimited')
+    parser.add_argument('--busy-loop', action='store_true',
+                        help='Pace frames with a busy loop, more precise than sleeping but uses a full core')
+    parser.add_argument('--max-frame-skip', type=int, default=2, metavar='N',
+                        help='Skip drawing up to N frames in a row when a frame would overrun its '
+                             'budget; 0 draws every frame')
+    parser.add_argument('--fast-forward', type=int, default=0, metavar='K',
+                        help='Run K physics steps per frame as fast as possible instead of in real time')
+    parser.add_argument('--no-render', action='store_true',
+                        help='Skip drawing entirely; only useful with --fast-forward')
+    parser.add_argument('--threaded', action='store_true',
+                        help='Simulate on a separate thread and draw its latest snapshot, so drawing one '
+                             'frame overlaps simulating the next')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Session seed; rounds and scenery are reproducible from it')
+    parser.add_argument('--record-replays', metavar='DIR', default=None,
+                        help='Save a replay of every finished round to DIR')
+    parser.add_argument('--telemetry', metavar='FILE', default=None,
+                        help='Append a binary record of every physics step of every round to FILE')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time each phase of every frame, show frame time percentiles on screen '
+                             'and write a trace on exit')
+    parser.add_argument('--trace', metavar='FILE', default='frame_trace.json',
+                        help='Where --profile writes its Chrome trace (default: frame_trace.json)')
+    parser.add_argument('--startup-benchmark', nargs='?', type=float, const=0, default=None,
+                        metavar='BUDGET_MS',
+                        help='Report the time to the first frame and exit; exits with status 1 if it '
+                             'took longer than BUDGET_MS')
     args = parser.parse_args()
+    if args.physics_hz <= 0:
+        parser.error('--physics-hz must be positive')
+    if args.fast_forward < 0:
+        parser.error('--fast-forward must not be negative')
+    if args.max_frame_skip < 0:
+        parser.error('--max-frame-skip must not be negative')
+    if args.threaded and args.fast_forward:
+        parser.error('--threaded runs in real time and cannot be combined with --fast-forward')
 
-    # Initialize Pygame
-    pygame.init()
+    # Initialize only the subsystems the game uses; pygame.init() would also
+    # bring up audio and joysticks. The display brings up events with it
+    pygame.display.init()
+    pygame.font.init()
 
     # Set up display with resizable flag
     screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
@@ -23,179 +150,232 @@ def main():
     
     pygame.display.set_caption("Flappy Bird Style Game")
 
-    # Clock for frame rate control
-    clock = pygame.time.Clock()
+    # Scales game_surface to the window, reallocating only on resize
+    output = OutputStage(screen, args.scale_mode)
+
+    # Frame rate control; physics runs in fixed steps regardless, and frames
+    # that would overrun their budget skip drawing. Fast-forward is uncapped
+    pacer = FramePacer(pygame.time.Clock(), 0 if args.fast_forward else args.fps,
+                       busy_loop=args.busy_loop, max_skip=args.max_frame_skip)
+    timestep = FixedTimestep(args.physics_hz)
 
-    # Game objects
-    bird = Bird(show_hitboxes=args.show_hitboxes)
-    obstacles = []
-    score = 0
-    game_state = "start"
-    background = Background()
+    # Seeded streams per subsystem; each round reseeds the gameplay stream
+    streams = RngStreams(args.seed)
+    recorder = ReplayRecorder() if args.record_replays else None
+    if recorder is not None:
+        os.makedirs(args.record_replays, exist_ok=True)
+
+    # Game rules live in the headless core; the entities are its render views
+    game = GameState(
+        rng=streams.gameplay,
+        bird_factory=partial(Bird, show_hitboxes=args.show_hitboxes),
+        obstacle_factory=partial(Obstacle, show_hitboxes=args.show_hitboxes, rng=streams.effects)
+    )
+    background = Background(rng=streams.scenery)
+    particles = get_particle_system()
     
-    # Initialize font with anti-aliasing
+    # Initialize font with anti-aliasing; the HUD caches everything it renders
     font = pygame.font.Font(None, 55)
+    hud = Hud(font)
+
+    # The rest of the setup runs after the first frame has been shown
+    warmup = deferred_work(game, hud)
+    setup_done = time.perf_counter()
 
-    def reset_game():
-        nonlocal bird, obstacles, score
-        bird = Bird(show_hitboxes=args.show_hitboxes)
-        obstacles = []
-        score = 0
+    # Optional per-phase timings, with an overlay and a trace written on exit
+    profiler = FrameProfiler() if args.profile else None
+    overlay = None
+    if profiler is not None:
+        # With --threaded the physics phases run on the other thread and
+        # are not timed
+        if not args.threaded:
+            game.profiler = profiler
+        overlay = ProfilerOverlay(pygame.font.Font(None, 26), profiler, pacer)
+
+        def finish_profile():
+            profiler.export(args.trace)
+            print(profiler.summary())
+            pacing = pacer.stats()
+            if pacing is not None:
+                print(f"Pacing: {pacing['fps']:.1f} fps, frame time {pacing['mean_ms']:.2f} ms "
+                      f"(jitter {pacing['jitter_ms']:.2f} ms, p99 {pacing['p99_ms']:.2f} ms, "
+                      f"max {pacing['max_ms']:.2f} ms), {pacing['skipped']:.1%} of frames not drawn")
+            print(f"Wrote frame trace to {args.trace}")
+        atexit.register(finish_profile)
+
+    # Optional per-step log of every round, appended to across sessions
+    telemetry = TelemetryRecorder(args.telemetry) if args.telemetry else None
+    if telemetry is not None:
+        atexit.register(telemetry.close)
+
+    # Optional dirty-rect mode restores only what moved from the static sky
+    dirty = DirtyRectRenderer(background.sky) if args.dirty_rects else None
+
+    def step_world(dt):
+        was_playing = game.game_state == PLAYING
+        update_world(game, background, particles, dt, game.profiler)
+        if telemetry is not None and was_playing:
+            telemetry.record(game, dt, streams.round_seed)
+
+        if recorder is not None and was_playing and game.game_state == GAME_OVER:
+            replay = recorder.finish(game.score, game.frame)
+            replay.save(os.path.join(args.record_replays, f"{replay.seed:016x}{REPLAY_EXTENSION}"))
+
+    def press():
+        if game.game_state == START:
+            # Every round has its own seed, so it can be replayed
+            round_seed = streams.new_round()
+            if recorder is not None:
+                recorder.start(round_seed, timestep.hz)
+        elif game.game_state == PLAYING and recorder is not None:
+            # The flap applies before the next physics step
+            recorder.flap(game.frame)
+
+        was_playing = game.game_state == PLAYING
+        game.press()
+        if not was_playing and game.game_state == PLAYING:
+            # A new round starts without the last round's particles
+            particles.clear()
+
+    # Optional pipelining: from here on the simulation thread owns the game,
+    # background and particles, and this thread draws from its snapshots
+    simulation = None
+    if args.threaded:
+        simulation = SimulationThread(
+            timestep, step_world, press,
+            lambda: (game.snapshot(), background.snapshot(), particles.snapshot())
+        )
+        simulation.start()
+        # Exit handlers run last to first, so the thread stops before the
+        # telemetry log it writes to is closed
+        atexit.register(simulation.stop)
+        published = simulation.steps
 
     while True:
-        dt = clock.tick(60) / 1000.0  # Delta time in seconds
+        if profiler is not None:
+            profiler.begin_frame()
+        frame_time = pacer.wait()
+        if simulation is not None:
+            if simulation.error is not None:
+                raise RuntimeError("The simulation thread failed") from simulation.error
+        elif args.fast_forward:
+            # Fixed number of steps per frame, with no frame rate cap
+            steps = args.fast_forward
+            alpha = 1.0
+        else:
+            # Delta time in seconds, turned into whole physics steps; a slow
+            # frame runs several steps so only rendering falls behind
+            steps = timestep.advance(frame_time)
+            alpha = timestep.alpha
+        if profiler is not None:
+            profiler.lap("wait")
+        pending_size = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if simulation is not None:
+                    simulation.stop()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.VIDEORESIZE:
-                # Update the screen while maintaining aspect ratio
-                window_width = event.w
-                window_height = event.h
-                
-                # Calculate the scaling factor to maintain aspect ratio
-                scale_w = window_width / WIDTH
-                scale_h = window_height / HEIGHT
-                scale_factor = min(scale_w, scale_h)
-                
-                # Calculate the new window size maintaining aspect ratio
-                new_width = int(WIDTH * scale_factor)
-                new_height = int(HEIGHT * scale_factor)
-                
-                # Update the screen with the new size
-                screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
+                # Only the last size of a burst of resize events matters
+                pending_size = (event.w, event.h)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    if game_state == "start":
-                        game_state = "playing"
-                        reset_game()
-                    elif game_state == "playing":
-                        bird.flap()
-                    elif game_state == "game_over":
-                        game_state = "start"
-
-        # Update background with current score
-        background.update(dt, score)
-
-        if game_state == "playing":
-            # Store bird's previous position
-            prev_x = bird.x
-            prev_y = bird.y
-            
-            bird.update(dt, score)
-
-            # Spawn obstacles
-            if not obstacles or obstacles[-1].x < WIDTH - SPACING:
-                gap_y = random.randint(GAP_HEIGHT // 2 + 50, HEIGHT - GROUND_HEIGHT - GAP_HEIGHT // 2 - 50)
-                obstacles.append(Obstacle(WIDTH, gap_y, score, show_hitboxes=args.show_hitboxes))
-
-            # Update obstacles and check for collisions
-            for obs in obstacles[:]:
-                prev_obs_x = obs.x
-                obs.update(dt, score)
-                
-                # Check for score
-                if obs.x < bird.x and not obs.passed:
-                    obs.passed = True
-                    score += 1
-                
-                # Remove if off screen
-                if obs.x < -OBSTACLE_WIDTH:
-                    obstacles.remove(obs)
-                    continue
-                
-                # Collision detection
-                top_rect, bottom_rect = obs.get_rects()
-                if bird.collides_with_rect(top_rect) or bird.collides_with_rect(bottom_rect):
-                    interpolation = 0.5
-                    bird.x = prev_x * interpolation + bird.x * (1 - interpolation)
-                    bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
-                    game_state = "game_over"
-                    break
-            
-            # Ground and ceiling collision
-            ground_rect = pygame.Rect(0, HEIGHT - GROUND_HEIGHT, WIDTH, GROUND_HEIGHT)
-            ceiling_rect = pygame.Rect(0, -GROUND_HEIGHT, WIDTH, GROUND_HEIGHT)
-            
-            if bird.collides_with_rect(ground_rect):
-                interpolation = 0.5
-                bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
-                bird.velocity = 0
-                game_state = "game_over"
-            elif bird.collides_with_rect(ceiling_rect):
-                interpolation = 0.5
-                bird.y = prev_y * interpolation + bird.y * (1 - interpolation)
-                bird.velocity = 0
-                game_state = "game_over"
-
-        # Clear the game surface
-        game_surface.fill((0, 0, 0))
-
-        # Render game on game_surface
-        background.draw(game_surface, show_hitboxes=args.show_hitboxes)
-        
-        if game_state == "playing":
-            for obs in obstacles:
-                obs.draw(game_surface)
-            bird.draw(game_surface)
-            
-            # Draw score with shadow effect
-            score_text = font.render(f"Score: {score}", True, BLACK)
-            shadow_text = font.render(f"Score: {score}", True, (50, 50, 50))
-            game_surface.blit(shadow_text, (12, 12))
-            game_surface.blit(score_text, (10, 10))
-            
-            # Draw current speed multiplier
-            speed_mult = get_speed_multiplier(score)
-            speed_text = font.render(f"Speed: {speed_mult:.1f}x", True, BLACK)
-            speed_shadow = font.render(f"Speed: {speed_mult:.1f}x", True, (50, 50, 50))
-            game_surface.blit(speed_shadow, (12, 52))
-            game_surface.blit(speed_text, (10, 50))
-            
-        elif game_state == "start":
-            start_text = font.render("Press SPACE to Start", True, WHITE)
-            shadow_text = font.render("Press SPACE to Start", True, BLACK)
-            text_rect = start_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            game_surface.blit(shadow_text, (text_rect.x + 2, text_rect.y + 2))
-            game_surface.blit(start_text, text_rect)
-            
-        elif game_state == "game_over":
-            texts = [
-                ("Game Over", -50),
-                (f"Score: {score}", 0),
-                ("Press SPACE to Restart", 50)
-            ]
-            
-            for text, y_offset in texts:
-                rendered_text = font.render(text, True, WHITE)
-                shadow_text = font.render(text, True, BLACK)
-                text_rect = rendered_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + y_offset))
-                game_surface.blit(shadow_text, (text_rect.x + 2, text_rect.y + 2))
-                game_surface.blit(rendered_text, text_rect)
-
-        # Scale the game surface to the window size
-        window_size = screen.get_size()
-        # Calculate scaling factors
-        scale_w = window_size[0] / WIDTH
-        scale_h = window_size[1] / HEIGHT
-        scale_factor = min(scale_w, scale_h)
-        
-        # Calculate the scaled dimensions
-        scaled_width = int(WIDTH * scale_factor)
-        scaled_height = int(HEIGHT * scale_factor)
-        
-        # Calculate position to center the game
-        x_offset = (window_size[0] - scaled_width) // 2
-        y_offset = (window_size[1] - scaled_height) // 2
-        
-        # Clear the screen
-        screen.fill((0, 0, 0))
-        
-        # Scale and blit the game surface
-        scaled_surface = pygame.transform.smoothscale(game_surface, (scaled_width, scaled_height))
-        screen.blit(scaled_surface, (x_offset, y_offset))
-
-        pygame.display.update()
+                    if simulation is not None:
+                        simulation.queue_press()
+                    else:
+                        press()
+
+        if pending_size is not None:
+            # pygame 2 resizes the window surface itself; only ask for a new
+            # mode if it did not
+            if screen.get_size() != pending_size:
+                screen = pygame.display.set_mode(pending_size, pygame.RESIZABLE)
+            output.resize(screen)
+            if dirty is not None:
+                dirty.invalidate()
+        if profiler is not None:
+            profiler.lap("events")
+
+        if simulation is not None:
+            # Draw the latest snapshot, moving things alpha of the way from
+            # its previous step as time passes since it was published
+            (view_game, view_background, view_particles), published_at = simulation.buffer.latest()
+            alpha = min(1.0, (time.perf_counter() - published_at) * timestep.hz)
+            total = simulation.steps
+            steps, published = total - published, total
+        else:
+            for _ in range(steps):
+                step_world(timestep.dt)
+            view_game, view_background, view_particles = game, background, particles
+        if profiler is not None:
+            profiler.count("obstacles", len(view_game.obstacles))
+            profiler.count("particles", len(view_particles))
+            profiler.count("physics_steps", steps)
+
+        # Input and physics have run; drawing is what gives way under load
+        if args.no_render or not pacer.should_render():
+            continue
+
+        # Clear the game surface, or only what was drawn last frame
+        if dirty is not None:
+            dirty.restore(game_surface)
+        else:
+            game_surface.fill((0, 0, 0))
+
+        # Render game on game_surface, collecting the rects that were drawn;
+        # moving things are drawn alpha of the way through the last step
+        drawn = draw_world(game_surface, view_game, view_background, view_particles, hud,
+                           show_hitboxes=args.show_hitboxes, draw_sky=dirty is None, alpha=alpha,
+                           profiler=profiler)
+        if overlay is not None:
+            drawn += overlay.draw(game_surface)
+            profiler.lap("hud")
+
+        changed = dirty.changed_rects(drawn) if dirty is not None else None
+
+        # Scale the game surface to the window and present it
+        output.present(game_surface, changed)
+        pacer.end_render()
+        if profiler is not None:
+            profiler.lap("present")
+
+        if args.startup_benchmark is not None:
+            report_startup(main_start, setup_done, warmup, args.startup_benchmark)
+        if warmup is not None:
+            # One piece of the deferred setup per frame
+            try:
+                next(warmup)
+            except StopIteration:
+                warmup = None
+
+def report_startup(main_start, setup_done, warmup, budget_ms):
+    # Called once the first frame is on screen
+    first_frame = time.perf_counter()
+    for _ in warmup:
+        pass
+    deferred = time.perf_counter() - first_frame
+
+    # From process start where the OS says when that was, else from
+    # IMPORT_START, which misses the interpreter starting up
+    since_import = (first_frame - IMPORT_START) * 1000
+    age = process_age()
+    if age is not None:
+        total = max(age * 1000, since_import)
+        print(f"Interpreter:      {total - since_import:8.1f} ms")
+    else:
+        total = since_import
+    print(f"Imports:          {(main_start - IMPORT_START) * 1000:8.1f} ms")
+    print(f"Init and setup:   {(setup_done - main_start) * 1000:8.1f} ms")
+    print(f"First frame:      {(first_frame - setup_done) * 1000:8.1f} ms")
+    since = "process start" if age is not None else "src.main import"
+    print(f"Time to first frame: {total:.1f} ms from {since} (deferred work after it: {deferred * 1000:.1f} ms)")
+    pygame.quit()
+    if budget_ms and total > budget_ms:
+        print(f"Over the budget of {budget_ms:g} ms")
+        sys.exit(1)
+    sys.exit(0)
+
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Rendering helpers shared by the game entities.
+Contains caches of pre-rendered artwork.
+"""
@@ -0,0 +1,60 @@
+import pygame
+from src.utils.constants import *
+
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+
+def merge_rects(rects):
+    """Clip rects to the screen and union the overlapping ones."""
+    merged = []
+    for rect in rects:
+        rect = rect.clip(SCREEN_RECT)
+        if not rect.width or not rect.height:
+            continue
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Opt-in dirty-rectangle rendering.
+
+    Only the regions drawn last frame are restored from the static
+    background layer, so nothing else on the game surface is touched.
+    Every draw call returns the rect it covered, and the union of last
+    frame's and this frame's rects is all that needs to reach the display.
+    """
+
+    def __init__(self, background_layer):
+        self.background_layer = background_layer
+        self.previous = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to restore and present the whole screen."""
+        self.full_redraw = True
+
+    def restore(self, surface):
+        if self.full_redraw:
+            surface.blit(self.background_layer, (0, 0))
+            return
+        for rect in self.previous:
+            surface.blit(self.background_layer, rect, rect)
+
+    def changed_rects(self, drawn):
+        """
+        Finish the frame given the rects drawn on it. Returns the regions
+        that differ from the previous frame, or None after a full redraw.
+        """
+        drawn = merge_rects(drawn)
+        if self.full_redraw:
+            changed = None
+            self.full_redraw = False
+        else:
+            changed = merge_rects(self.previous + drawn)
+        self.previous = drawn
+        return changed
@@ -0,0 +1,212 @@
+import numpy as np
+import pygame
+from src.utils.constants import *
+
+SHADOW_OFFSET = 2
+SCORE_SHADOW = (50, 50, 50)
+
+
+def render_shadowed(font, text, color, shadow_color, offset=SHADOW_OFFSET):
+    """Render text with its drop shadow composited into one surface."""
+    text_surface = font.render(text, True, color)
+    shadow_surface = font.render(text, True, shadow_color)
+    width, height = text_surface.get_size()
+    size = (width + offset, height + offset)
+
+    # Plain blits between two translucent layers lose the anti-aliasing, so
+    # do the "over" composite explicitly
+    text_rgb = np.zeros(size + (3,))
+    text_alpha = np.zeros(size)
+    shadow_rgb = np.zeros(size + (3,))
+    shadow_alpha = np.zeros(size)
+    text_rgb[:width, :height] = pygame.surfarray.pixels3d(text_surface)
+    text_alpha[:width, :height] = pygame.surfarray.pixels_alpha(text_surface) / 255
+    shadow_rgb[offset:, offset:] = pygame.surfarray.pixels3d(shadow_surface)
+    shadow_alpha[offset:, offset:] = pygame.surfarray.pixels_alpha(shadow_surface) / 255
+
+    alpha = text_alpha + shadow_alpha * (1 - text_alpha)
+    rgb = text_rgb * text_alpha[..., None] + shadow_rgb * (shadow_alpha * (1 - text_alpha))[..., None]
+    rgb /= np.maximum(alpha, 1e-9)[..., None]
+
+    label = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(label)[...] = np.rint(rgb).astype(np.uint8)
+    pygame.surfarray.pixels_alpha(label)[...] = np.rint(alpha * 255).astype(np.uint8)
+    return label
+
+
+class Label:
+    """A shadowed text label that is only re-rendered when its text changes."""
+
+    def __init__(self, font, color, shadow_color):
+        self.font = font
+        self.color = color
+        self.shadow_color = shadow_color
+        self.text = None
+        self.surface = None
+        self.text_size = (0, 0)
+
+    def set(self, text):
+        if text != self.text:
+            self.text = text
+            self.surface = render_shadowed(self.font, text, self.color, self.shadow_color)
+            self.text_size = self.font.size(text)
+        return self
+
+    def topleft_for_center(self, center):
+        # Center the text itself; the shadow hangs off the bottom right
+        rect = pygame.Rect((0, 0), self.text_size)
+        rect.center = center
+        return rect.topleft
+
+    def draw(self, screen, pos):
+        return screen.blit(self.surface, pos)
+
+
+class GlyphAtlas:
+    """
+    Shadowed glyphs rendered once, for numbers that change every frame.
+    Text is drawn glyph by glyph, so no font rendering happens per frame.
+    """
+
+    def __init__(self, font, color, shadow_color, chars="0123456789.:%x- "):
+        self.glyphs = {}
+        self.height = font.get_linesize() + SHADOW_OFFSET
+        for char in chars:
+            self.glyphs[char] = (render_shadowed(font, char, color, shadow_color), font.size(char)[0])
+
+    def width(self, text):
+        return sum(self.glyphs[char][1] for char in text)
+
+    def draw(self, screen, text, pos):
+        # Glyphs are wider than their advance by the shadow, so the drawn
+        # area is the union of the blits, not the advances
+        x, y = pos
+        drawn = pygame.Rect(pos, (0, 0))
+        for char in text:
+            glyph, advance = self.glyphs[char]
+            drawn.union_ip(screen.blit(glyph, (x, y)))
+            x += advance
+        return drawn
+
+
+def build_overlay(font, lines):
+    """
+    Composite centered (text, y_offset) lines into one surface covering
+    just their bounds. Returns (surface, topleft).
+    """
+    placed = []
+    for text, y_offset in lines:
+        label = Label(font, WHITE, BLACK).set(text)
+        placed.append((label.surface, label.topleft_for_center((WIDTH // 2, HEIGHT // 2 + y_offset))))
+
+    bounds = pygame.Rect(placed[0][1], placed[0][0].get_size())
+    for surface, topleft in placed[1:]:
+        bounds.union_ip(pygame.Rect(topleft, surface.get_size()))
+
+    overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for surface, (x, y) in placed:
+        overlay.blit(surface, (x - bounds.x, y - bounds.y))
+    return overlay, bounds.topleft
+
+
+class Hud:
+    """
+    Score and speed readouts plus the start and game-over overlays, all
+    cached. The fixed "Score: " and "Speed: " prefixes are labels rendered
+    once; the numbers after them are composed from a GlyphAtlas, so a
+    changing score never re-renders text.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.score_prefix = Label(font, BLACK, SCORE_SHADOW)
+        self.speed_prefix = Label(font, BLACK, SCORE_SHADOW)
+        self.digits = None
+        self.start_overlay = build_overlay(font, [("Press SPACE to Start", 0)])
+        self._game_over_score = None
+        self._game_over_overlay = None
+
+    def prepare_playing(self):
+        """Render the prefixes and glyphs, e.g. ahead of time while the start screen is up."""
+        if self.digits is None:
+            self.score_prefix.set("Score: ")
+            self.speed_prefix.set("Speed: ")
+            self.digits = GlyphAtlas(self.font, BLACK, SCORE_SHADOW, chars="0123456789.x")
+
+    def _draw_field(self, screen, prefix, text, pos):
+        x, y = pos
+        prefix_rect = prefix.draw(screen, pos)
+        return prefix_rect.union(self.digits.draw(screen, text, (x + prefix.text_size[0], y)))
+
+    def draw_playing(self, screen, score):
+        self.prepare_playing()
+        score_rect = self._draw_field(screen, self.score_prefix, str(score), (10, 10))
+        # Current speed multiplier
+        speed_rect = self._draw_field(screen, self.speed_prefix, f"{get_speed_multiplier(score):.1f}x", (10, 50))
+        return [score_rect, speed_rect]
+
+    def draw_start(self, screen):
+        overlay, topleft = self.start_overlay
+        return [screen.blit(overlay, topleft)]
+
+    def draw_game_over(self, screen, score):
+        if score != self._game_over_score:
+            self._game_over_score = score
+            self._game_over_overlay = build_overlay(self.font, [
+                ("Game Over", -50),
+                (f"Score: {score}", 0),
+                ("Press SPACE to Restart", 50)
+            ])
+        overlay, topleft = self._game_over_overlay
+        return [screen.blit(overlay, topleft)]
+
+
+class ProfilerOverlay:
+    """
+    Frame time percentiles, FPS and the phase behind the worst frame, from a
+    FrameProfiler, drawn in the top right corner. The numbers are refreshed
+    every `refresh` frames so they stay readable; the text is drawn from a
+    GlyphAtlas, so drawing costs no font rendering. With a FramePacer, its
+    frame time jitter and share of undrawn frames are shown as well.
+    """
+
+    def __init__(self, font, profiler, pacer=None, refresh=30):
+        self.profiler = profiler
+        self.pacer = pacer
+        self.refresh = refresh
+        self.atlas = GlyphAtlas(font, WHITE, BLACK, chars="0123456789.:%x- abcdefghijklmnopqrstuvwxyz_")
+        self.lines = []
+        self._refreshed_at = None
+
+    def _update_lines(self):
+        stats = self.profiler.stats()
+        if stats is None:
+            self.lines = []
+            return
+        self.lines = [
+            f"fps {stats['fps']:.1f}",
+            f"p50 {stats['p50']:.1f} ms",
+            f"p95 {stats['p95']:.1f} ms",
+            f"p99 {stats['p99']:.1f} ms",
+            f"max {stats['worst']:.1f} ms",
+            f"{stats['worst_phase']} {stats['worst_phase_ms']:.1f} ms",
+        ]
+        pacing = self.pacer.stats() if self.pacer is not None else None
+        if pacing is not None:
+            self.lines += [
+                f"jitter {pacing['jitter_ms']:.1f} ms",
+                f"skipped {pacing['skipped'] * 100:.0f}%",
+            ]
+
+    def draw(self, screen):
+        frames = self.profiler.frames
+        if self._refreshed_at is None or frames - self._refreshed_at >= self.refresh:
+            self._refreshed_at = frames
+            self._update_lines()
+
+        rects = []
+        y = 10
+        for line in self.lines:
+            rects.append(self.atlas.draw(screen, line, (WIDTH - 10 - self.atlas.width(line), y)))
+            y += self.atlas.height
+        return rects
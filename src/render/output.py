@@ -0,0 +1,97 @@
+import math
+import pygame
+from src.utils.constants import *
+
+SCALE_MODES = ('smooth', 'fast', 'integer')
+
+
+class OutputStage:
+    """
+    Presents the fixed-size game surface in a window of any size while
+    keeping the aspect ratio.
+
+    Scale, offset and the destination buffer are only recomputed when the
+    window size changes; every frame then scales into the same buffer via
+    the transform functions' dest argument, or blits directly at 1x.
+    Modes: 'smooth' (smoothscale), 'fast' (nearest neighbour) and
+    'integer' (nearest neighbour at the largest whole-number factor).
+    """
+
+    def __init__(self, screen, mode='smooth'):
+        if mode not in SCALE_MODES:
+            raise ValueError(f"Unknown scale mode: {mode}")
+        self.mode = mode
+        self.screen = None
+        self.window_size = None
+        self.resize(screen)
+
+    def resize(self, screen):
+        """Adopt a new display surface; cheap if the size did not change."""
+        self.screen = screen
+        window_size = screen.get_size()
+        if window_size == self.window_size:
+            return
+        self.window_size = window_size
+
+        # Calculate the scaling factor to maintain aspect ratio
+        scale_factor = min(window_size[0] / WIDTH, window_size[1] / HEIGHT)
+        if self.mode == 'integer' and scale_factor >= 1:
+            scale_factor = math.floor(scale_factor)
+
+        # Calculate the scaled dimensions and center the game
+        self.scaled_size = (max(1, int(WIDTH * scale_factor)), max(1, int(HEIGHT * scale_factor)))
+        self.offset = ((window_size[0] - self.scaled_size[0]) // 2,
+                       (window_size[1] - self.scaled_size[1]) // 2)
+        self.rect = pygame.Rect(self.offset, self.scaled_size)
+        self.scale_x = self.scaled_size[0] / WIDTH
+        self.scale_y = self.scaled_size[1] / HEIGHT
+
+        # Scaled frames are written into a buffer allocated on the next frame
+        self.unscaled = self.scaled_size == (WIDTH, HEIGHT)
+        self.buffer = None
+
+        # The letterbox borders only need clearing once per resize
+        self.clear_pending = True
+
+    def _screen_rect(self, rect):
+        # Map a game-surface rect to the window, growing it by a pixel first
+        # so smoothscale's filtering at the edges is covered
+        if not self.unscaled:
+            rect = rect.inflate(2, 2)
+        left = math.floor(rect.left * self.scale_x)
+        top = math.floor(rect.top * self.scale_y)
+        right = math.ceil(rect.right * self.scale_x)
+        bottom = math.ceil(rect.bottom * self.scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top).clip((0, 0), self.scaled_size)
+
+    def present(self, surface, changed=None):
+        """
+        Scale surface to the window and update the display. When changed is
+        a list of game-surface rects, only those regions reach the display.
+        """
+        if self.unscaled:
+            frame = surface
+        else:
+            if self.buffer is None:
+                # Match the game surface's pixel format, as the dest argument requires
+                self.buffer = pygame.Surface(self.scaled_size, 0, surface)
+            if self.mode == 'smooth':
+                pygame.transform.smoothscale(surface, self.scaled_size, self.buffer)
+            else:
+                pygame.transform.scale(surface, self.scaled_size, self.buffer)
+            frame = self.buffer
+
+        if self.clear_pending:
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(frame, self.offset)
+            pygame.display.update()
+            self.clear_pending = False
+        elif changed is None:
+            self.screen.blit(frame, self.offset)
+            pygame.display.update(self.rect)
+        else:
+            screen_rects = []
+            for rect in changed:
+                area = self._screen_rect(rect)
+                screen_rects.append(self.screen.blit(frame, area.move(self.offset), area))
+            pygame.display.update(screen_rects)
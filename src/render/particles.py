@@ -0,0 +1,114 @@
+import copy
+import numpy as np
+import pygame
+
+ALPHA_STEP = 16  # Particle alpha is drawn in buckets of this many levels
+COLOR_STEP = 32  # Likewise for each color channel
+FULL_ALPHA_LIFE = 1.5  # Remaining life at which a particle would be fully opaque
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity particle pool stored as parallel NumPy arrays.
+
+    Live particles occupy the first `count` slots. update() ages and moves
+    them all at once and compacts the dead ones away; draw() blits sprites
+    from a cache keyed by size, alpha bucket and color bucket, so neither
+    allocates surfaces per frame.
+    """
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.size = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, dx, dy, size, life, color):
+        # A full pool drops new particles rather than growing
+        if self.count == self.capacity:
+            return
+        i = self.count
+        self.position[i] = (x, y)
+        self.velocity[i] = (dx, dy)
+        self.size[i] = size
+        self.life[i] = life
+        self.color[i] = color
+        self.count += 1
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        life = self.life[:n]
+        life -= dt
+
+        # Compact the survivors to the front of the arrays
+        alive = life > 0
+        if not alive.all():
+            n = int(alive.sum())
+            for arr in (self.position, self.velocity, self.size, self.life, self.color):
+                arr[:n] = arr[:self.count][alive]
+            self.count = n
+
+        self.position[:n] += self.velocity[:n] * dt
+        self.size[:n] *= 0.95
+
+    def snapshot(self):
+        """
+        A copy of the live particles that later updates leave alone, for
+        drawing on another thread. It shares the sprite cache, so only one
+        thread should draw.
+        """
+        view = copy.copy(self)
+        n = self.count
+        view.capacity = n
+        for name in ("position", "velocity", "size", "life", "color"):
+            setattr(view, name, getattr(self, name)[:n].copy())
+        return view
+
+    def _sprite(self, size, alpha_bucket, color_key):
+        key = (size, alpha_bucket, color_key)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            color = tuple(c * COLOR_STEP + COLOR_STEP // 2 for c in color_key)
+            alpha = min(alpha_bucket * ALPHA_STEP + ALPHA_STEP // 2, 255)
+            pygame.draw.circle(sprite, (*color, alpha), (size // 2, size // 2), size // 2)
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        n = self.count
+        if not n:
+            return []
+        sizes = self.size[:n].astype(np.int64)
+        alphas = (255 * (self.life[:n] / FULL_ALPHA_LIFE)).astype(np.int64) // ALPHA_STEP
+        colors = self.color[:n] // COLOR_STEP
+        positions = self.position[:n].astype(np.int64)
+
+        blits = []
+        for i in np.flatnonzero(sizes > 0):
+            sprite = self._sprite(int(sizes[i]), int(alphas[i]), tuple(colors[i].tolist()))
+            blits.append((sprite, (int(positions[i, 0]), int(positions[i, 1]))))
+        return screen.blits(blits)
+
+
+_system = None
+
+
+def get_particle_system():
+    """Return the shared ParticleSystem, creating it on first use."""
+    global _system
+    if _system is None:
+        _system = ParticleSystem()
+    return _system
@@ -0,0 +1,87 @@
+import pygame
+from src.utils.constants import *
+
+# Define cute colors
+PIPE_MAIN = (67, 205, 94)  # Main pipe color (matching grass)
+PIPE_LIGHT = (87, 225, 114)  # Highlight color
+PIPE_DARK = (47, 185, 74)  # Shadow color
+PIPE_OUTLINE = (39, 143, 59)  # Dark outline
+
+CAP_HEIGHT = 30
+BODY_INSET = 5  # The body is narrower than the cap by this much on each side
+BODY_WIDTH = OBSTACLE_WIDTH - 2 * BODY_INSET
+EDGE_HEIGHT = 2  # Outline thickness at the open ends of the body
+
+
+class PipeTextures:
+    """
+    Pipe artwork rendered once and shared by every Obstacle.
+
+    A pipe is drawn from three opaque pieces: a full-height body strip that
+    is cropped to the pipe length, the outline edge closing each end of the
+    body, and the cap. Spawning a pipe therefore allocates nothing, and
+    memory stays flat however many pipes are alive.
+    """
+
+    def __init__(self):
+        # Body strip: fill, highlight, shadow and the two side outlines
+        self.body = pygame.Surface((BODY_WIDTH, HEIGHT))
+        self.body.fill(PIPE_MAIN)
+        pygame.draw.rect(self.body, PIPE_LIGHT, (0, 0, 3, HEIGHT))
+        pygame.draw.rect(self.body, PIPE_DARK, (BODY_WIDTH - 3, 0, 3, HEIGHT))
+        pygame.draw.rect(self.body, PIPE_OUTLINE, (0, 0, EDGE_HEIGHT, HEIGHT))
+        pygame.draw.rect(self.body, PIPE_OUTLINE, (BODY_WIDTH - EDGE_HEIGHT, 0, EDGE_HEIGHT, HEIGHT))
+
+        # Outline across an open end of the body
+        self.edge = pygame.Surface((BODY_WIDTH, EDGE_HEIGHT))
+        self.edge.fill(PIPE_OUTLINE)
+
+        # End cap
+        self.cap = pygame.Surface((OBSTACLE_WIDTH, CAP_HEIGHT))
+        self.cap.fill(PIPE_MAIN)
+        pygame.draw.rect(self.cap, PIPE_LIGHT, (0, 0, 3, CAP_HEIGHT))
+        pygame.draw.rect(self.cap, PIPE_DARK, (OBSTACLE_WIDTH - 3, 0, 3, CAP_HEIGHT))
+        pygame.draw.rect(self.cap, PIPE_OUTLINE, (0, 0, OBSTACLE_WIDTH, CAP_HEIGHT), 2)
+
+        # Switch to the display pixel format once one exists
+        if pygame.display.get_surface() is not None:
+            self.body = self.body.convert()
+            self.edge = self.edge.convert()
+            self.cap = self.cap.convert()
+
+    def _draw_body(self, screen, x, top, height):
+        if height <= 0:
+            return []
+        body_x = x + BODY_INSET
+        # The edges lie inside the body, so its rect covers them
+        body_rect = screen.blit(self.body, (body_x, top), (0, 0, BODY_WIDTH, height))
+        screen.blit(self.edge, (body_x, top))
+        screen.blit(self.edge, (body_x, top + height - EDGE_HEIGHT))
+        return [body_rect]
+
+    def draw(self, screen, x, gap_y):
+        """Draw one pipe pair and return the rects that were touched."""
+        # Blit positions are truncated like pygame does for float positions
+        x = int(x)
+
+        # Top pipe: body from the top of the screen, cap just above the gap
+        top_height = int(gap_y - GAP_HEIGHT / 2)
+        dirty = self._draw_body(screen, x, 0, top_height)
+        dirty.append(screen.blit(self.cap, (x, top_height)))
+
+        # Bottom pipe: cap just below the gap, body down to the bottom
+        bottom_top = int(gap_y + GAP_HEIGHT / 2)
+        dirty += self._draw_body(screen, x, bottom_top, HEIGHT - bottom_top)
+        dirty.append(screen.blit(self.cap, (x, bottom_top - CAP_HEIGHT)))
+        return dirty
+
+
+_textures = None
+
+
+def get_pipe_textures():
+    """Return the shared PipeTextures, building them on first use."""
+    global _textures
+    if _textures is None:
+        _textures = PipeTextures()
+    return _textures
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+import pygame
+
+
+def _round_coord(value):
+    # pygame rounds float rect positions half away from zero
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
+
+
+class RotatedSpriteCache:
+    """
+    Bounded LRU cache of rotated, optionally faded, copies of sprites.
+
+    Entries are keyed by (name, quantized angle, alpha) and store the
+    rotated surface together with the offset from its center to its top
+    left corner, so drawing a cached sprite is a single blit.
+    """
+
+    def __init__(self, max_entries=512, angle_step=1):
+        self.max_entries = max_entries
+        self.angle_step = angle_step
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def quantize(self, angle):
+        return round(angle / self.angle_step) * self.angle_step
+
+    def get(self, name, surface, angle, alpha=None):
+        """Return (rotated_surface, (offset_x, offset_y)) for surface turned by angle degrees."""
+        key = (name, self.quantize(angle), alpha)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        source = surface
+        if alpha is not None:
+            source = surface.copy()
+            source.set_alpha(alpha)
+        rotated = pygame.transform.rotate(source, key[1])
+        width, height = rotated.get_size()
+        entry = (rotated, (-(width // 2), -(height // 2)))
+
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+
+def blit_centered(screen, entry, center):
+    """Blit a cache entry so that its center lands on center."""
+    sprite, (offset_x, offset_y) = entry
+    return screen.blit(sprite, (_round_coord(center[0]) + offset_x, _round_coord(center[1]) + offset_y))
@@ -0,0 +1,144 @@
+import os
+import sys
+import json
+import pygame
+
+# Resolved from the package location so the game can run from any directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets', 'images')
+
+# Written by scripts/build_atlas.py; the loose images are used without it
+ATLAS_DIR = os.path.join(ROOT_DIR, 'assets', 'atlas')
+ATLAS_MANIFEST = 'atlas.json'
+ATLAS_IMAGE = 'atlas.png'
+
+
+class AssetRegistry:
+    """
+    Process-wide image cache.
+
+    Each file is read and decoded once, and each (file, size, alpha)
+    variant is scaled once. Once a display exists, cached surfaces are
+    converted to its pixel format the next time they are requested.
+    Missing or unreadable files are reported once on stderr and replaced
+    by a transparent placeholder.
+
+    If a texture atlas has been built, sprites it packs are handed out as
+    subsurfaces of the one atlas image instead of being read separately.
+    Only the atlas itself is converted; its subsurfaces are then taken
+    again from the converted atlas, so they keep sharing its pixels.
+    """
+
+    def __init__(self, root=ASSETS_DIR, atlas_dir=ATLAS_DIR):
+        self.root = root
+        self.atlas_dir = atlas_dir
+        self.missing = set()
+        self._images = {}  # filename -> [surface or None, converted(, atlas rect)]
+        self._scaled = {}  # (filename, size, alpha) -> [surface, converted(, atlas rect)]
+        self._atlas = None  # [surface entry, sprites] once loaded, False if unavailable
+
+    def _convert(self, entry):
+        # Convert cached surfaces lazily, once a display mode is set
+        if not entry[1] and entry[0] is not None and pygame.display.get_surface() is not None:
+            if len(entry) > 2:
+                # A region of the atlas: take it again from the converted
+                # atlas rather than converting it into a copy of its own
+                entry[0] = self._convert(self._atlas[0]).subsurface(entry[2])
+            else:
+                entry[0] = entry[0].convert_alpha()
+            entry[1] = True
+        return entry[0]
+
+    def _load_atlas(self):
+        if self._atlas is None:
+            self._atlas = False
+            manifest_path = os.path.join(self.atlas_dir, ATLAS_MANIFEST)
+            if os.path.exists(manifest_path):
+                try:
+                    with open(manifest_path) as f:
+                        manifest = json.load(f)
+                    surface = pygame.image.load(os.path.join(self.atlas_dir, manifest['image']))
+                except (OSError, ValueError, KeyError, pygame.error) as e:
+                    print(f"Ignoring texture atlas in {self.atlas_dir}: {e}", file=sys.stderr)
+                else:
+                    self._atlas = [[surface, False], manifest['sprites']]
+        return self._atlas
+
+    def _atlas_entry(self, filename, size=None):
+        # A cache entry sharing the packed variant of exactly this size, or
+        # the largest one if size is None. Returns None if the atlas does not
+        # have it.
+        atlas = self._load_atlas()
+        if not atlas:
+            return None
+        variants = atlas[1].get(filename.replace(os.sep, '/'))
+        if not variants:
+            return None
+        if size is None:
+            variant = max(variants, key=lambda v: v['size'][0] * v['size'][1])
+        else:
+            variant = next((v for v in variants if tuple(v['size']) == tuple(size)), None)
+            if variant is None:
+                return None
+        surface = self._convert(atlas[0]).subsurface(variant['rect'])
+        return [surface, atlas[0][1], variant['rect']]
+
+    def image(self, filename):
+        """
+        Return the decoded image, or None if it is missing. Images taken from
+        the atlas may be stored smaller than the original file.
+        """
+        entry = self._images.get(filename)
+        if entry is None:
+            entry = self._atlas_entry(filename)
+            if entry is None:
+                path = os.path.join(self.root, filename)
+                try:
+                    surface = pygame.image.load(path)
+                except (OSError, pygame.error) as e:
+                    self.missing.add(filename)
+                    print(f"Missing asset {path}: {e}", file=sys.stderr)
+                    surface = None
+                entry = [surface, False]
+            self._images[filename] = entry
+        return self._convert(entry)
+
+    def scaled(self, filename, size, alpha=None):
+        """Return the image scaled to size, with an optional surface alpha."""
+        key = (filename, tuple(size), alpha)
+        entry = self._scaled.get(key)
+        if entry is None:
+            # Pre-scaled in the atlas; shared unless its alpha will change
+            entry = self._atlas_entry(filename, size)
+            if entry is not None and alpha is not None:
+                entry = [entry[0].copy(), entry[1]]
+            if entry is None:
+                image = self.image(filename)
+                if image is None:
+                    # Create a transparent surface if image loading fails
+                    surface = pygame.Surface(size, pygame.SRCALPHA)
+                    surface.fill((0, 0, 0, 0))  # Completely transparent
+                else:
+                    surface = pygame.transform.scale(image, size)
+                entry = [surface, False]
+            if alpha is not None:
+                entry[0].set_alpha(alpha)
+            self._scaled[key] = entry
+        return self._convert(entry)
+
+    def clear(self):
+        self._images.clear()
+        self._scaled.clear()
+        self.missing.clear()
+        self._atlas = None
+
+
+_registry = None
+
+
+def get_assets():
+    """Return the shared AssetRegistry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = AssetRegistry()
+    return _registry
@@ -1,13 +1,5 @@
-import os
-import pygame
+from src.utils.assets import get_assets
 
-def load_scaled_image(filename, size):
-    """Load and scale an image from the assets directory."""
-    try:
-        image = pygame.image.load(os.path.join('assets', 'images', filename))
-        return pygame.transform.scale(image, size)
-    except:
-        # Create a transparent surface if image loading fails
-        surface = pygame.Surface(size, pygame.SRCALPHA)
-        surface.fill((0, 0, 0, 0))  # Completely transparent
-        return surface 
\ No newline at end of file
+def load_scaled_image(filename, size, alpha=None):
+    """Load and scale an image from the assets directory, cached process-wide."""
+    return get_assets().scaled(filename, size, alpha)
@@ -0,0 +1,53 @@
+"""
+Startup helpers shared by the entry points that load pygame.
+
+Kept free of pygame and the game modules, so an entry point can use them
+before importing either.
+"""
+
+import os
+import sys
+import time
+
+
+def import_pygame():
+    """
+    Import and return pygame without loading pkg_resources.
+
+    pygame.pkgdata looks its data files up through pkg_resources when
+    setuptools is installed, and importing pkg_resources alone takes longer
+    than the rest of the game's startup. While pygame is imported the name
+    is blocked in sys.modules, so pkgdata falls back to reading the files
+    next to pygame directly; the block is lifted afterwards, so anything
+    else can still import pkg_resources.
+
+    Entry points call this before their first `import pygame`. It makes no
+    difference once pygame or pkg_resources is already loaded.
+    """
+    if 'pygame' in sys.modules or 'pkg_resources' in sys.modules:
+        import pygame
+        return pygame
+    sys.modules['pkg_resources'] = None
+    try:
+        import pygame
+    finally:
+        if sys.modules.get('pkg_resources', False) is None:
+            del sys.modules['pkg_resources']
+    return pygame
+
+
+def process_age():
+    """
+    Seconds since this process started, or None where the OS does not say.
+
+    Counts interpreter startup too, which a timer taken in Python misses.
+    Linux only, and to the kernel's clock tick (usually 10 ms).
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            stat = f.read()
+        # Fields after the parenthesized command name; starttime is field 22
+        start_ticks = int(stat.rpartition(')')[2].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None